@@ -20,25 +20,123 @@ License: MIT
 
 # Standard library imports (alphabetical)
 import argparse
+import hashlib
 import json
 import os
+import re
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Optional: in-process libgit2 backend (pip install pygit2)
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# Optional: faster JSON serialization (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 __version__ = "1.0.0"
 __author__ = "ATLAS (Team Brain)"
 
+# Directory names never descended into while searching for repos
+_SKIP_DIRS = frozenset((
+    "node_modules", "__pycache__", "venv", "env", "vendor",
+    "build", "dist", "target",
+))
+
+
+def _build_porcelain_v2_table() -> Dict[bytes, Tuple[int, int, int, int]]:
+    """
+    Precompute file-state deltas for `git status --porcelain=v2` entries.
+
+    Keys are the first four characters of a changed-entry line ("1 XY",
+    "2 XY" or "u XY"); values are (staged, modified, deleted, conflict)
+    increments, so the parse loop is a dict lookup instead of a branch
+    chain per line.
+    """
+    codes = ".MTADRCU"
+    table = {}
+    for x in codes:
+        for y in codes:
+            staged = 1 if x in "AMRC" else 0
+            modified = 1 if y == "M" else 0
+            deleted = (x == "D") + (y == "D")
+            delta = (staged, modified, deleted, 0)
+            table[f"1 {x}{y}".encode()] = delta
+            table[f"2 {x}{y}".encode()] = delta
+            table[f"u {x}{y}".encode()] = (0, 0, 0, 1)
+    return table
+
+
+_PORCELAIN_V2_TABLE = _build_porcelain_v2_table()
+
+# %(upstream:track) output: "[ahead N]", "[behind N]", "[ahead N, behind M]"
+_TRACK_RE = re.compile(r"\[(?:ahead (\d+))?(?:, )?(?:behind (\d+))?\]")
+
+# Metadata queries issued by _get_repo_status
+_REMOTE_ARGS = ("remote", "-v")
+_LAST_COMMIT_ARGS = ("log", "-1", "--format=%aI|||%s")
+_COMMIT_COUNT_ARGS = ("rev-list", "--count", "HEAD")
+_REF_COUNT_ARGS = (
+    "for-each-ref", "--format=%(refname:rstrip=-2)",
+    "refs/heads", "refs/tags", "refs/stash",
+)
+
+# Memoized git query results for one repo: args -> (stdout, stderr, rc)
+QueryCache = Dict[Tuple[str, ...], Tuple[str, str, int]]
+
+# Leading argv of every git command GitPulse runs. All queries are
+# read-only; --no-optional-locks stops `git status` from taking index.lock
+# to refresh the index, which would contend with concurrent scans and with
+# the user's own git operations. git exports it as GIT_OPTIONAL_LOCKS=0, so
+# submodule statuses it spawns inherit it. On Windows, fscache batches the
+# work-tree stat calls.
+_GIT_PREFIX = ["git", "--no-optional-locks"]
+if sys.platform == "win32":
+    _GIT_PREFIX += ["-c", "core.fscache=true"]
+
+# Letter grade for every possible health score (index 0-100)
+_GRADE_BY_SCORE = "F" * 60 + "D" * 10 + "C" * 10 + "B" * 10 + "A" * 11
+
+# Files and directories inside .git whose mtimes change whenever the
+# output of a cached (working-tree independent) git query could change.
+# "shallow" covers fetch --unshallow/--deepen; the reftable entries cover
+# repos using the reftable ref backend, where HEAD and refs/ are stubs.
+_FINGERPRINT_PATHS = (
+    "HEAD", "index", "config", "packed-refs", "logs/HEAD",
+    "logs/refs/stash", "refs", "refs/heads", "refs/tags",
+    "shallow", "reftable", "reftable/tables.list",
+)
+
+# Ref namespaces whose nested directories are fingerprinted too: a loose
+# ref such as refs/heads/feat/x only touches the mtime of its own
+# directory, not of refs/heads
+_FINGERPRINT_REF_TREES = ("refs/heads", "refs/tags")
+
 
 # ---------------------------------------------------------------------------
 # Data Classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+# __slots__ drops the per-instance __dict__; dataclass(slots=) needs 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class BranchInfo:
     """Information about a single git branch."""
     name: str
@@ -49,8 +147,20 @@ class BranchInfo:
     behind: int = 0
     tracking: str = ""
 
-
-@dataclass
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "name": self.name,
+            "is_current": self.is_current,
+            "last_commit_date": self.last_commit_date,
+            "last_commit_age_days": self.last_commit_age_days,
+            "ahead": self.ahead,
+            "behind": self.behind,
+            "tracking": self.tracking,
+        }
+
+
+@dataclass(**_SLOTS)
 class RepoStatus:
     """Detailed status of a single git repository."""
     name: str
@@ -69,7 +179,7 @@ class RepoStatus:
     last_commit_date: str = ""
     last_commit_age_days: int = 0
     last_commit_message: str = ""
-    total_commits: int = 0
+    total_commits: int = 0  # -1: has commits, but not counted
     branch_count: int = 0
     tag_count: int = 0
     is_dirty: bool = False
@@ -81,10 +191,36 @@ class RepoStatus:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
-
-
-@dataclass
+        return {
+            "name": self.name,
+            "path": self.path,
+            "current_branch": self.current_branch,
+            "staged_count": self.staged_count,
+            "modified_count": self.modified_count,
+            "untracked_count": self.untracked_count,
+            "deleted_count": self.deleted_count,
+            "conflict_count": self.conflict_count,
+            "stash_count": self.stash_count,
+            "ahead": self.ahead,
+            "behind": self.behind,
+            "has_remote": self.has_remote,
+            "remote_url": self.remote_url,
+            "last_commit_date": self.last_commit_date,
+            "last_commit_age_days": self.last_commit_age_days,
+            "last_commit_message": self.last_commit_message,
+            "total_commits": self.total_commits,
+            "branch_count": self.branch_count,
+            "tag_count": self.tag_count,
+            "is_dirty": self.is_dirty,
+            "is_detached": self.is_detached,
+            "health_score": self.health_score,
+            "health_grade": self.health_grade,
+            "issues": list(self.issues),
+            "error": self.error,
+        }
+
+
+@dataclass(**_SLOTS)
 class ScanResult:
     """Result of scanning a directory for git repositories."""
     root_dir: str
@@ -99,8 +235,30 @@ class ScanResult:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        result = asdict(self)
-        return result
+        return {
+            "root_dir": self.root_dir,
+            "scan_time": self.scan_time,
+            "total_repos": self.total_repos,
+            "healthy_count": self.healthy_count,
+            "warning_count": self.warning_count,
+            "critical_count": self.critical_count,
+            "error_count": self.error_count,
+            "repos": [r.to_dict() for r in self.repos],
+            "scan_duration_ms": self.scan_duration_ms,
+        }
+
+
+# Predicates shared by the find_* methods and the CLI filters
+def _is_dirty(status: RepoStatus) -> bool:
+    return status.is_dirty
+
+
+def _is_unsynced(status: RepoStatus) -> bool:
+    return status.ahead > 0 or status.behind > 0
+
+
+def _has_no_remote(status: RepoStatus) -> bool:
+    return not status.has_remote
 
 
 # ---------------------------------------------------------------------------
@@ -122,37 +280,94 @@ class GitPulse:
         ...     print(f"  {repo.name}: {repo.health_grade}")
     """
 
-    def __init__(self, max_depth: int = 3, timeout: int = 10):
+    def __init__(self, max_depth: int = 3, timeout: int = 10,
+                 max_workers: Optional[int] = None,
+                 ignore_symlinks: bool = False, backend: str = "git",
+                 cache_dir: Optional[str] = None,
+                 exact_commit_count: bool = True,
+                 scan_ttl: float = 0.0,
+                 skip_dirs: Optional[Iterable[str]] = None):
         """
         Initialize GitPulse.
 
         Args:
             max_depth: Maximum directory depth to search for repos
             timeout: Timeout in seconds for git commands
+            max_workers: Number of repos to analyze concurrently
+                (default: min(32, cpu_count * 4))
+            ignore_symlinks: Don't follow symlinked directories when
+                searching for repos
+            backend: "git" to run the git CLI, or "pygit2" to read repos
+                in-process through libgit2 (requires pygit2)
+            cache_dir: Directory to persist metadata query results in
+                between runs (default: None, in-memory only)
+            exact_commit_count: Count every commit for total_commits; when
+                False, repos with history report -1 instead of walking it
+            scan_ttl: Seconds a scan() result may be reused for repeat
+                calls on the same root, e.g. chained find_* calls
+                (default: 0, always rescan)
+            skip_dirs: Directory names never searched for repos (default:
+                node_modules, __pycache__, venv, env, vendor, build, dist,
+                target). Hidden directories are always skipped.
         """
         if max_depth < 1:
             raise ValueError("max_depth must be >= 1")
         if timeout < 1:
             raise ValueError("timeout must be >= 1")
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if scan_ttl < 0:
+            raise ValueError("scan_ttl must be >= 0")
+        if backend not in ("git", "pygit2"):
+            raise ValueError("backend must be 'git' or 'pygit2'")
+        if backend == "pygit2" and pygit2 is None:
+            raise ValueError("backend 'pygit2' requires: pip install pygit2")
         self.max_depth = max_depth
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.ignore_symlinks = ignore_symlinks
+        self.backend = backend
+        self.cache_dir = cache_dir
+        self.exact_commit_count = exact_commit_count
+        self.scan_ttl = scan_ttl
+        self.skip_dirs = _SKIP_DIRS if skip_dirs is None else frozenset(skip_dirs)
+        # (root_dir, monotonic timestamp, result) of the latest scan()
+        self._last_scan: Optional[Tuple[str, float, ScanResult]] = None
+        # repo_path -> (fingerprint, {args: result}) for read-only queries
+        self._git_cache: Dict[str, Tuple[Tuple[int, ...], QueryCache]] = {}
 
     # -------------------------------------------------------------------
     # Git Command Helpers
     # -------------------------------------------------------------------
 
-    def _run_git(self, repo_path: Path, *args: str) -> Tuple[str, str, int]:
+    def _git_command(self, repo_path: Path, args: Tuple[str, ...],
+                     git_dir_only: bool = False) -> List[str]:
+        """Build the argv for a git command in the given repository."""
+        if git_dir_only:
+            # Point git straight at the .git directory: no repository
+            # discovery and no work tree setup
+            location = "--git-dir=" + os.path.join(str(repo_path), ".git")
+            return _GIT_PREFIX + [location] + list(args)
+        return _GIT_PREFIX + ["-C", str(repo_path)] + list(args)
+
+    def _run_git(self, repo_path: Path, *args: str,
+                 git_dir_only: bool = False) -> Tuple[str, str, int]:
         """
         Run a git command in the given repository.
 
         Args:
             repo_path: Path to the git repository
             *args: Git command arguments
+            git_dir_only: The command only reads repository metadata and
+                repo_path/.git is a directory; address it with --git-dir
+                instead of -C
 
         Returns:
             Tuple of (stdout, stderr, returncode)
         """
-        cmd = ["git", "-C", str(repo_path)] + list(args)
+        cmd = self._git_command(repo_path, args, git_dir_only)
         try:
             result = subprocess.run(
                 cmd,
@@ -170,39 +385,264 @@ class GitPulse:
         except Exception as e:
             return "", str(e), 1
 
-    def _find_repos(self, root: Path, depth: int = 0) -> List[Path]:
+    @contextmanager
+    def _git_stream(self, repo_path: Path, *args: str) -> Iterator[subprocess.Popen]:
         """
-        Recursively find git repositories under root.
+        Run a git command whose stdout is consumed incrementally.
+
+        Yields the running process; iterate ``proc.stdout`` for raw bytes
+        lines so large outputs are never held in memory at once. The
+        process is killed if it outlives the timeout, and its return code
+        is available once the block exits.
 
         Args:
-            root: Root directory to search
-            depth: Current search depth
+            repo_path: Path to the git repository
+            *args: Git command arguments
+
+        Raises:
+            OSError: If git cannot be started
+        """
+        proc = subprocess.Popen(
+            self._git_command(repo_path, args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        timer = threading.Timer(self.timeout, proc.kill)
+        timer.daemon = True
+        timer.start()
+        try:
+            yield proc
+        finally:
+            proc.stdout.close()
+            try:
+                proc.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            timer.cancel()
+
+    def _git_fingerprint(self, repo_path: Path) -> Optional[Tuple[int, ...]]:
+        """
+        Fingerprint the repository metadata that cached queries depend on.
+
+        Args:
+            repo_path: Path to the git repository
 
         Returns:
-            List of paths to git repositories
+            Tuple of (mtime, size) pairs, flattened, or None if the repo
+            has no .git directory (worktrees, submodules), in which case
+            nothing is cached. Sizes catch rewrites and reflog appends that
+            land within the filesystem's mtime granularity. Every
+            directory below refs/heads and refs/tags is included, so
+            nested loose refs invalidate the cache as well.
         """
-        repos = []
-        if depth > self.max_depth:
-            return repos
+        git_dir = os.path.join(str(repo_path), ".git")
+        if not os.path.isdir(git_dir):
+            return None
+        stamps = []
+        for rel in _FINGERPRINT_PATHS:
+            try:
+                st = os.stat(os.path.join(git_dir, rel))
+                stamps.append(st.st_mtime_ns)
+                stamps.append(st.st_size)
+            except OSError:
+                stamps.append(0)
+                stamps.append(-1)
+        stack = [os.path.join(git_dir, rel) for rel in _FINGERPRINT_REF_TREES]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            st = entry.stat(follow_symlinks=False)
+                            stamps.append(st.st_mtime_ns)
+                            stamps.append(st.st_size)
+                            stack.append(entry.path)
+            except OSError:
+                pass
+        return tuple(stamps)
+
+    def _cached_queries(self, repo_path: Path) -> Optional[QueryCache]:
+        """
+        Get the metadata query cache for a repository.
+
+        The cache is reset whenever the repo's fingerprint changes. With a
+        cache_dir, a fresh cache is seeded from the previous run's results.
+
+        Args:
+            repo_path: Path to the git repository
 
+        Returns:
+            Dict of git args -> result to pass to _run_git_cached, or None
+            if the repo can't be fingerprinted
+        """
+        fingerprint = self._git_fingerprint(repo_path)
+        if fingerprint is None:
+            return None
+        repo_key = str(repo_path)
+        entry = self._git_cache.get(repo_key)
+        if entry is None or entry[0] != fingerprint:
+            queries = {}
+            if self.cache_dir:
+                queries = self._load_query_cache(repo_key, fingerprint)
+            entry = (fingerprint, queries)
+            self._git_cache[repo_key] = entry
+        return entry[1]
+
+    def _query_cache_file(self, repo_key: str) -> str:
+        """Path of the on-disk query cache for a repository."""
+        digest = hashlib.sha1(repo_key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _load_query_cache(self, repo_key: str,
+                          fingerprint: Tuple[int, ...]) -> QueryCache:
+        """Read persisted query results, if they match the fingerprint."""
         try:
-            git_dir = root / ".git"
-            if git_dir.exists() and git_dir.is_dir():
-                repos.append(root)
-                return repos  # Don't recurse into git repos (submodules aside)
-
-            for entry in sorted(root.iterdir()):
-                if entry.is_dir() and not entry.name.startswith("."):
-                    # Skip known non-project directories
-                    if entry.name in ("node_modules", "__pycache__", "venv",
-                                      ".venv", "env", ".env", "vendor",
-                                      "build", "dist", "target"):
-                        continue
-                    repos.extend(self._find_repos(entry, depth + 1))
-        except PermissionError:
-            pass
+            with open(self._query_cache_file(repo_key), encoding="utf-8") as f:
+                data = json.load(f)
+            if data["path"] != repo_key or data["fingerprint"] != list(fingerprint):
+                return {}
+            return {tuple(args): tuple(result) for args, result in data["queries"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save_query_cache(self, repo_path: Path) -> None:
+        """Persist a repository's query results to cache_dir (best effort)."""
+        repo_key = str(repo_path)
+        entry = self._git_cache.get(repo_key)
+        if not self.cache_dir or entry is None:
+            return
+        fingerprint, queries = entry
+        data = {
+            "path": repo_key,
+            "fingerprint": list(fingerprint),
+            "queries": [[list(a), list(r)] for a, r in queries.items()],
+        }
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._query_cache_file(repo_key))
         except OSError:
-            pass
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _run_git_cached(self, repo_path: Path, queries: Optional[QueryCache],
+                        *args: str) -> Tuple[str, str, int]:
+        """
+        Run a git query, reusing the previous result while the repo is unchanged.
+
+        Only use this for queries that don't read the working tree (log,
+        rev-list, for-each-ref, ...); `git status` must always run.
+
+        Args:
+            repo_path: Path to the git repository
+            queries: Result of _cached_queries(repo_path)
+            *args: Git command arguments
+
+        Returns:
+            Tuple of (stdout, stderr, returncode)
+        """
+        if queries is None:
+            return self._run_git(repo_path, *args)
+        cached = queries.get(args)
+        if cached is not None:
+            return cached
+        # The cached queries never touch the work tree, so address the
+        # .git directory directly when there is one. get_status() also
+        # passes a scratch cache for paths below the top level or with a
+        # .git file, where git has to discover the repository itself.
+        result = self._run_git(
+            repo_path, *args,
+            git_dir_only=os.path.isdir(os.path.join(str(repo_path), ".git")),
+        )
+        if result[2] == 0:
+            queries[args] = result
+        return result
+
+    def _prefetch_queries(self, repo_path: Path,
+                          queries: QueryCache) -> ThreadPoolExecutor:
+        """
+        Start the uncached metadata queries for a repo in the background.
+
+        Results land in ``queries``, where the following _run_git_cached
+        calls pick them up. Shut the returned executor down (waiting)
+        before reading them.
+
+        Args:
+            repo_path: Path to the git repository
+            queries: Query cache for the repo
+
+        Returns:
+            The executor running the queries
+        """
+        wanted = [_REMOTE_ARGS, _LAST_COMMIT_ARGS, _REF_COUNT_ARGS]
+        if self.exact_commit_count:
+            wanted.append(_COMMIT_COUNT_ARGS)
+        executor = ThreadPoolExecutor(max_workers=len(wanted))
+        for args in wanted:
+            if args not in queries:
+                executor.submit(self._run_git_cached, repo_path, queries, *args)
+        return executor
+
+    def _find_repos(self, root: Path) -> List[Path]:
+        """
+        Find git repositories under root, up to max_depth levels deep.
+
+        Args:
+            root: Root directory to search
+
+        Returns:
+            List of paths to git repositories (unordered)
+        """
+        repos = []
+        skip_dirs = self.skip_dirs
+        stack = [(str(root), 0)]
+
+        while stack:
+            path, depth = stack.pop()
+            if depth >= self.max_depth:
+                # Leaves are never listed; a single stat settles them
+                if os.path.isdir(os.path.join(path, ".git")):
+                    repos.append(Path(path))
+                continue
+
+            # Directories above the cutoff are listed anyway, so spot .git
+            # in the listing rather than stat'ing for it separately
+            try:
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except OSError:
+                continue  # Includes PermissionError
+
+            subdirs = []
+            is_repo = False
+            for entry in entries:
+                name = entry.name
+                try:
+                    if name == ".git":
+                        if entry.is_dir():
+                            is_repo = True
+                            break
+                        continue
+                    if name.startswith(".") or name in skip_dirs:
+                        continue
+                    if self.ignore_symlinks and entry.is_symlink():
+                        continue
+                    if entry.is_dir():
+                        subdirs.append(entry.path)
+                except OSError:
+                    pass
+
+            if is_repo:
+                repos.append(Path(path))  # Don't recurse into git repos
+            else:
+                stack.extend((sub, depth + 1) for sub in subdirs)
 
         return repos
 
@@ -210,62 +650,110 @@ class GitPulse:
     # Repository Analysis
     # -------------------------------------------------------------------
 
-    def _get_repo_status(self, repo_path: Path) -> RepoStatus:
+    def _get_repo_status(self, repo_path: Path,
+                         now: Optional[datetime] = None,
+                         parallel_queries: bool = False) -> RepoStatus:
         """
         Get comprehensive status of a single repository.
 
         Args:
             repo_path: Path to the git repository
+            now: Reference time for commit ages (default: current UTC
+                time); scan() passes one value for all repos
+            parallel_queries: Run the independent metadata queries on
+                worker threads while `git status` runs. Only worthwhile
+                when repos aren't already being analyzed concurrently.
 
         Returns:
             RepoStatus with all details filled in
         """
+        if now is None:
+            now = datetime.now(timezone.utc)
+        if self.backend == "pygit2":
+            return self._get_repo_status_pygit2(repo_path, now)
+
         status = RepoStatus(
             name=repo_path.name,
             path=str(repo_path),
         )
 
-        # Check git is working in this repo
-        stdout, stderr, rc = self._run_git(repo_path, "rev-parse", "--git-dir")
-        if rc != 0:
-            status.error = f"Not a valid git repo: {stderr}"
-            status.health_score = 0
-            status.health_grade = "F"
-            return status
+        # Metadata-only queries are memoized against the repo's fingerprint
+        # so repeated scans (chained finders, or later runs with a
+        # cache_dir) skip them
+        queries = self._cached_queries(repo_path)
+        known_queries = len(queries) if queries is not None else 0
+
+        prefetch = None
+        if parallel_queries:
+            if queries is None:
+                queries = {}  # Scratch cache for this call only
+            prefetch = self._prefetch_queries(repo_path, queries)
+
+        # Branch, upstream tracking and file states in a single call. This
+        # is also the validity check: it fails outside a working repo.
+        upstream_ab = None
+        head_oid = ""
+        staged = modified = untracked = deleted = conflicts = 0
+        try:
+            with self._git_stream(
+                repo_path, "status", "--porcelain=v2", "--branch"
+            ) as proc:
+                for line in proc.stdout:
+                    delta = _PORCELAIN_V2_TABLE.get(line[:4])
+                    if delta is not None:
+                        staged += delta[0]
+                        modified += delta[1]
+                        deleted += delta[2]
+                        conflicts += delta[3]
+                    elif line.startswith(b"? "):
+                        untracked += 1
+                    elif line.startswith(b"# "):
+                        header = line[2:].decode("utf-8", "replace").rstrip("\n")
+                        key, _, value = header.partition(" ")
+                        if key == "branch.oid":
+                            head_oid = value
+                        elif key == "branch.head":
+                            status.current_branch = value
+                        elif key == "branch.ab":
+                            parts = value.split()
+                            if len(parts) == 2:
+                                try:
+                                    upstream_ab = (int(parts[0]), -int(parts[1]))
+                                except ValueError:
+                                    pass
+            rc = proc.returncode
+        except OSError:
+            rc = 1
+        finally:
+            if prefetch is not None:
+                prefetch.shutdown(wait=True)
 
-        # Current branch
-        stdout, _, rc = self._run_git(repo_path, "branch", "--show-current")
-        if rc == 0 and stdout:
-            status.current_branch = stdout
+        if rc != 0:
+            # Only a failed status pays for the probe that explains why
+            _, stderr, rc = self._run_git(repo_path, "rev-parse", "--git-dir")
+            if rc != 0:
+                status.error = f"Not a valid git repo: {stderr}"
+                status.health_score = 0
+                status.health_grade = "F"
+                return status
+            status.current_branch = "(unknown)"
+            upstream_ab = None
         else:
-            # Check for detached HEAD
-            stdout2, _, rc2 = self._run_git(repo_path, "rev-parse", "--short", "HEAD")
-            if rc2 == 0:
-                status.current_branch = f"(detached at {stdout2})"
-                status.is_detached = True
-            else:
+            status.staged_count = staged
+            status.modified_count = modified
+            status.untracked_count = untracked
+            status.deleted_count = deleted
+            status.conflict_count = conflicts
+
+            if status.current_branch == "(detached)":
+                if head_oid and head_oid != "(initial)":
+                    status.current_branch = f"(detached at {head_oid[:7]})"
+                    status.is_detached = True
+                else:
+                    status.current_branch = "(unknown)"
+            elif not status.current_branch:
                 status.current_branch = "(unknown)"
 
-        # Porcelain status for file counts
-        stdout, _, rc = self._run_git(repo_path, "status", "--porcelain=v1")
-        if rc == 0 and stdout:
-            for line in stdout.split("\n"):
-                if len(line) >= 2:
-                    x, y = line[0], line[1]
-                    if x == "?" and y == "?":
-                        status.untracked_count += 1
-                    elif x == "U" or y == "U" or (x == "A" and y == "A") or (x == "D" and y == "D"):
-                        status.conflict_count += 1
-                    else:
-                        if x in ("A", "M", "R", "C"):
-                            status.staged_count += 1
-                        if x == "D":
-                            status.deleted_count += 1
-                        if y == "M":
-                            status.modified_count += 1
-                        if y == "D":
-                            status.deleted_count += 1
-
         status.is_dirty = (
             status.staged_count > 0
             or status.modified_count > 0
@@ -275,7 +763,7 @@ class GitPulse:
         )
 
         # Remote info
-        stdout, _, rc = self._run_git(repo_path, "remote", "-v")
+        stdout, _, rc = self._run_git_cached(repo_path, queries, *_REMOTE_ARGS)
         if rc == 0 and stdout:
             status.has_remote = True
             lines = stdout.split("\n")
@@ -286,68 +774,226 @@ class GitPulse:
         else:
             status.has_remote = False
 
-        # Ahead/behind
-        if status.has_remote and not status.is_detached:
-            stdout, _, rc = self._run_git(
-                repo_path, "rev-list", "--left-right", "--count",
-                f"{status.current_branch}@{{upstream}}...HEAD"
-            )
-            if rc == 0 and stdout:
-                parts = stdout.split()
-                if len(parts) == 2:
+        # Ahead/behind (reported by status when an upstream is configured)
+        if status.has_remote and not status.is_detached and upstream_ab:
+            status.ahead, status.behind = upstream_ab
+
+        # Last commit info
+        stdout, _, rc = self._run_git_cached(repo_path, queries, *_LAST_COMMIT_ARGS)
+        if rc == 0 and stdout:
+            self._apply_last_commit(status, stdout, now)
+
+            # Total commits (an unborn HEAD has none, so only count here).
+            # Counting walks the whole history, which is slow on big repos.
+            if not self.exact_commit_count:
+                status.total_commits = -1
+            else:
+                stdout, _, rc = self._run_git_cached(
+                    repo_path, queries, *_COMMIT_COUNT_ARGS
+                )
+                if rc == 0 and stdout:
                     try:
-                        status.behind = int(parts[0])
-                        status.ahead = int(parts[1])
+                        status.total_commits = int(stdout)
                     except ValueError:
                         pass
 
-        # Last commit info
-        stdout, _, rc = self._run_git(
-            repo_path, "log", "-1", "--format=%aI|||%s"
-        )
+        # Branch, tag and stash counts from one ref listing. Each ref is
+        # printed as just its namespace ("refs/heads", ...), so counting is
+        # a substring count rather than a split over every ref name.
+        has_stash = False
+        stdout, _, rc = self._run_git_cached(repo_path, queries, *_REF_COUNT_ARGS)
         if rc == 0 and stdout:
-            parts = stdout.split("|||", 1)
-            if len(parts) == 2:
-                status.last_commit_date = parts[0]
-                status.last_commit_message = parts[1][:120]
+            status.branch_count = stdout.count("refs/heads")
+            status.tag_count = stdout.count("refs/tags")
+            has_stash = "refs/stash" in stdout
+
+        # Stash count (entries live in the reflog, so only ask when present)
+        if has_stash:
+            stdout, _, rc = self._run_git_cached(
+                repo_path, queries, "rev-list", "--walk-reflogs", "--count",
+                "refs/stash"
+            )
+            if rc == 0 and stdout:
                 try:
-                    commit_dt = datetime.fromisoformat(parts[0])
-                    now = datetime.now(timezone.utc)
-                    if commit_dt.tzinfo is None:
-                        commit_dt = commit_dt.replace(tzinfo=timezone.utc)
-                    delta = now - commit_dt
-                    status.last_commit_age_days = delta.days
-                except (ValueError, TypeError):
+                    status.stash_count = int(stdout)
+                except ValueError:
                     pass
 
-        # Total commits
-        stdout, _, rc = self._run_git(repo_path, "rev-list", "--count", "HEAD")
-        if rc == 0 and stdout:
+        if queries is not None and len(queries) != known_queries:
+            self._save_query_cache(repo_path)
+
+        # Calculate health
+        status.health_score, status.health_grade, status.issues = (
+            self._calculate_health(status)
+        )
+
+        return status
+
+    def _apply_last_commit(self, status: RepoStatus, stdout: str,
+                           now: datetime) -> None:
+        """Fill the last_commit_* fields from _LAST_COMMIT_ARGS output."""
+        parts = stdout.split("|||", 1)
+        if len(parts) == 2:
+            status.last_commit_date = parts[0]
+            status.last_commit_message = parts[1][:120]
             try:
-                status.total_commits = int(stdout)
-            except ValueError:
+                # %aI is always offset-aware
+                delta = now - datetime.fromisoformat(parts[0])
+                status.last_commit_age_days = delta.days
+            except (ValueError, TypeError):
                 pass
 
-        # Branch count
-        stdout, _, rc = self._run_git(repo_path, "branch", "--list")
-        if rc == 0 and stdout:
-            status.branch_count = len([
-                b for b in stdout.split("\n") if b.strip()
-            ])
+    def _get_last_commit(self, repo_path: Path, now: datetime) -> RepoStatus:
+        """
+        Get only the last commit of a repository.
 
-        # Tag count
-        stdout, _, rc = self._run_git(repo_path, "tag", "--list")
-        if rc == 0 and stdout:
-            status.tag_count = len([
-                t for t in stdout.split("\n") if t.strip()
-            ])
+        Runs the (memoized) log query and nothing else: no `git status`,
+        no health scoring.
 
-        # Stash count
-        stdout, _, rc = self._run_git(repo_path, "stash", "list")
+        Args:
+            repo_path: Path to the git repository
+            now: Reference time for the commit age
+
+        Returns:
+            RepoStatus with name, path and the last_commit_* fields set
+        """
+        status = RepoStatus(
+            name=repo_path.name,
+            path=str(repo_path),
+        )
+        queries = self._cached_queries(repo_path)
+        known_queries = len(queries) if queries is not None else 0
+        stdout, _, rc = self._run_git_cached(repo_path, queries, *_LAST_COMMIT_ARGS)
         if rc == 0 and stdout:
-            status.stash_count = len([
-                s for s in stdout.split("\n") if s.strip()
-            ])
+            self._apply_last_commit(status, stdout, now)
+        if queries is not None and len(queries) != known_queries:
+            self._save_query_cache(repo_path)
+        return status
+
+    def _get_repo_status_pygit2(self, repo_path: Path,
+                                now: Optional[datetime] = None) -> RepoStatus:
+        """
+        Get comprehensive status of a single repository through libgit2.
+
+        Produces the same RepoStatus as _get_repo_status without spawning
+        any git processes.
+
+        Args:
+            repo_path: Path to the git repository
+            now: Reference time for commit ages (default: current UTC time)
+
+        Returns:
+            RepoStatus with all details filled in
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+        status = RepoStatus(
+            name=repo_path.name,
+            path=str(repo_path),
+        )
+
+        try:
+            repo = pygit2.Repository(str(repo_path))
+        except (pygit2.GitError, KeyError) as e:
+            status.error = f"Not a valid git repo: {e}"
+            status.health_score = 0
+            status.health_grade = "F"
+            return status
+
+        # Current branch
+        head_commit = None
+        if repo.head_is_unborn:
+            target = repo.references["HEAD"].target
+            status.current_branch = target[len("refs/heads/"):]
+        elif repo.head_is_detached:
+            status.current_branch = f"(detached at {str(repo.head.target)[:7]})"
+            status.is_detached = True
+            head_commit = repo[repo.head.target]
+        else:
+            status.current_branch = repo.head.shorthand
+            head_commit = repo[repo.head.target]
+
+        # File states. Without the submodule cache libgit2 looks every
+        # submodule up again for each path it checks.
+        if (repo.workdir and hasattr(repo.submodules, "cache_all")
+                and os.path.exists(os.path.join(repo.workdir, ".gitmodules"))):
+            repo.submodules.cache_all()
+        index_new = index_deleted = 0
+        for flags in repo.status(untracked_files="normal").values():
+            if flags & pygit2.GIT_STATUS_CONFLICTED:
+                status.conflict_count += 1
+                continue
+            if flags & pygit2.GIT_STATUS_WT_NEW:
+                status.untracked_count += 1
+            if flags & (pygit2.GIT_STATUS_INDEX_NEW
+                        | pygit2.GIT_STATUS_INDEX_MODIFIED
+                        | pygit2.GIT_STATUS_INDEX_RENAMED):
+                status.staged_count += 1
+            if flags & pygit2.GIT_STATUS_INDEX_NEW:
+                index_new += 1
+            if flags & pygit2.GIT_STATUS_INDEX_DELETED:
+                status.deleted_count += 1
+                index_deleted += 1
+            if flags & pygit2.GIT_STATUS_WT_MODIFIED:
+                status.modified_count += 1
+            if flags & pygit2.GIT_STATUS_WT_DELETED:
+                status.deleted_count += 1
+
+        # repo.status() has no rename detection, so a staged `git mv` shows
+        # up as a deletion plus an addition. git status pairs them into a
+        # rename, so do the same with a similarity pass over the index diff.
+        if index_new and index_deleted and head_commit is not None:
+            diff = repo.index.diff_to_tree(head_commit.tree)
+            diff.find_similar()
+            status.deleted_count -= sum(
+                1 for delta in diff.deltas
+                if delta.status == pygit2.GIT_DELTA_RENAMED
+            )
+
+        status.is_dirty = (
+            status.staged_count > 0
+            or status.modified_count > 0
+            or status.untracked_count > 0
+            or status.deleted_count > 0
+            or status.conflict_count > 0
+        )
+
+        # Remote info
+        remotes = sorted(repo.remotes, key=lambda r: r.name)
+        status.has_remote = bool(remotes)
+        if remotes:
+            status.remote_url = remotes[0].url or ""
+
+        # Ahead/behind
+        if status.has_remote and head_commit is not None and not status.is_detached:
+            branch = repo.branches.local.get(status.current_branch)
+            upstream = branch.upstream if branch is not None else None
+            if upstream is not None:
+                status.ahead, status.behind = repo.ahead_behind(
+                    head_commit.id, upstream.target
+                )
+
+        # Last commit info and total commits
+        if head_commit is not None:
+            author = head_commit.author
+            tz = timezone(timedelta(minutes=author.offset))
+            commit_dt = datetime.fromtimestamp(author.time, tz)
+            status.last_commit_date = commit_dt.isoformat()
+            subject = head_commit.message.split("\n\n", 1)[0]
+            status.last_commit_message = " ".join(subject.split("\n")).strip()[:120]
+            delta = now - commit_dt
+            status.last_commit_age_days = delta.days
+            if self.exact_commit_count:
+                status.total_commits = sum(1 for _ in repo.walk(head_commit.id))
+            else:
+                status.total_commits = -1
+
+        # Branch, tag and stash counts
+        status.branch_count = len(list(repo.branches.local))
+        status.tag_count = sum(
+            1 for ref in repo.references if ref.startswith("refs/tags/")
+        )
+        status.stash_count = len(repo.listall_stashes())
 
         # Calculate health
         status.health_score, status.health_grade, status.issues = (
@@ -432,23 +1078,46 @@ class GitPulse:
 
         score = max(0, score)
 
-        if score >= 90:
-            grade = "A"
-        elif score >= 80:
-            grade = "B"
-        elif score >= 70:
-            grade = "C"
-        elif score >= 60:
-            grade = "D"
-        else:
-            grade = "F"
-
-        return score, grade, issues
+        return score, _GRADE_BY_SCORE[score], issues
 
     # -------------------------------------------------------------------
     # Public API Methods
     # -------------------------------------------------------------------
 
+    def _resolve_root(self, root_dir: str) -> Path:
+        """Validate a scan root and return it as an absolute Path."""
+        if not root_dir:
+            raise ValueError("root_dir cannot be empty")
+
+        root = Path(root_dir).resolve()
+        if not root.exists():
+            raise FileNotFoundError(f"Directory not found: {root}")
+        if not root.is_dir():
+            raise ValueError(f"Not a directory: {root}")
+        return root
+
+    def _map_repos(self, fn: Callable[[Path], RepoStatus],
+                   repo_paths: List[Path]) -> List[RepoStatus]:
+        """
+        Apply fn to every repo path, concurrently when worthwhile.
+
+        Each repo costs several blocking git subprocesses, so they run on a
+        thread pool (the time is spent waiting on git, not in Python, and
+        threads share the query cache). A lone repo skips the pool entirely.
+
+        Args:
+            fn: Callable returning the status of one repository
+            repo_paths: Repository paths to analyze
+
+        Returns:
+            Results in the same order as repo_paths
+        """
+        workers = min(self.max_workers, len(repo_paths))
+        if workers <= 1:
+            return [fn(rp) for rp in repo_paths]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, repo_paths))
+
     def scan(self, root_dir: str) -> ScanResult:
         """
         Scan a directory tree for git repositories and analyze health.
@@ -463,17 +1132,19 @@ class GitPulse:
             ValueError: If root_dir is empty
             FileNotFoundError: If root_dir doesn't exist
         """
-        if not root_dir:
-            raise ValueError("root_dir cannot be empty")
+        root = self._resolve_root(root_dir)
 
-        root = Path(root_dir).resolve()
-        if not root.exists():
-            raise FileNotFoundError(f"Directory not found: {root}")
-        if not root.is_dir():
-            raise ValueError(f"Not a directory: {root}")
+        last_scan = self._last_scan
+        if (self.scan_ttl and last_scan is not None
+                and last_scan[0] == str(root)
+                and time.monotonic() - last_scan[1] < self.scan_ttl):
+            cached = last_scan[2]
+            return replace(cached, repos=list(cached.repos))
 
-        start_time = time.time()
-        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Monotonic: a wall-clock adjustment mid-scan can't skew the duration
+        start_ns = time.monotonic_ns()
+        now = datetime.now(timezone.utc)
+        now_str = now.astimezone().strftime("%Y-%m-%d %H:%M:%S")
 
         result = ScanResult(
             root_dir=str(root),
@@ -483,8 +1154,11 @@ class GitPulse:
         repo_paths = self._find_repos(root)
         result.total_repos = len(repo_paths)
 
-        for rp in repo_paths:
-            repo_status = self._get_repo_status(rp)
+        statuses = self._map_repos(
+            lambda rp: self._get_repo_status(rp, now), repo_paths
+        )
+
+        for repo_status in statuses:
             result.repos.append(repo_status)
 
             if repo_status.error:
@@ -496,11 +1170,15 @@ class GitPulse:
             else:
                 result.critical_count += 1
 
-        elapsed = time.time() - start_time
-        result.scan_duration_ms = int(elapsed * 1000)
+        result.scan_duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
         # Sort by health score (worst first for attention)
-        result.repos.sort(key=lambda r: (r.health_score, r.name))
+        result.repos.sort(key=attrgetter("health_score", "name"))
+
+        if self.scan_ttl:
+            self._last_scan = (
+                str(root), time.monotonic(), replace(result, repos=list(result.repos))
+            )
 
         return result
 
@@ -525,7 +1203,45 @@ class GitPulse:
         if not path.exists():
             raise FileNotFoundError(f"Repository not found: {path}")
 
-        return self._get_repo_status(path)
+        # A single repo gets no benefit from scan()'s per-repo pool, so
+        # overlap its own independent queries instead
+        return self._get_repo_status(path, parallel_queries=True)
+
+    def scan_filtered(
+        self, root_dir: str,
+        predicates: Dict[str, Callable[[RepoStatus], bool]],
+    ) -> Dict[str, List[RepoStatus]]:
+        """
+        Scan once and group the repos by several predicates.
+
+        Use this instead of calling several find_* methods, which each
+        scan the tree.
+
+        Args:
+            root_dir: Path to scan
+            predicates: Group name -> test applied to each RepoStatus
+
+        Returns:
+            Group name -> matching repos, in scan order (worst health
+            first). A repo can appear in several groups.
+
+        Example:
+            >>> groups = pulse.scan_filtered(".", {
+            ...     "dirty": lambda r: r.is_dirty,
+            ...     "no_remote": lambda r: not r.has_remote,
+            ... })
+        """
+        result = self.scan(root_dir)
+        groups: Dict[str, List[RepoStatus]] = {name: [] for name in predicates}
+        checks = [
+            (predicate, groups[name].append)
+            for name, predicate in predicates.items()
+        ]
+        for repo in result.repos:
+            for predicate, add in checks:
+                if predicate(repo):
+                    add(repo)
+        return groups
 
     def find_dirty(self, root_dir: str) -> List[RepoStatus]:
         """
@@ -537,8 +1253,7 @@ class GitPulse:
         Returns:
             List of RepoStatus for dirty repos
         """
-        result = self.scan(root_dir)
-        return [r for r in result.repos if r.is_dirty]
+        return self.scan_filtered(root_dir, {"dirty": _is_dirty})["dirty"]
 
     def find_stale(self, root_dir: str, days: int = 30) -> List[RepoStatus]:
         """
@@ -553,8 +1268,40 @@ class GitPulse:
         """
         if days < 1:
             raise ValueError("days must be >= 1")
-        result = self.scan(root_dir)
-        return [r for r in result.repos if r.last_commit_age_days > days]
+        return self.scan_filtered(
+            root_dir, {"stale": lambda r: r.last_commit_age_days > days}
+        )["stale"]
+
+    def find_stale_fast(self, root_dir: str, days: int = 30) -> List[RepoStatus]:
+        """
+        Find repositories with no recent commits, reading only commit dates.
+
+        Much cheaper than find_stale(): each repo costs one memoized
+        `git log -1` instead of a full analysis, and `git status` never
+        runs. The returned RepoStatus objects only have name, path and
+        the last_commit_* fields filled in. With the pygit2 backend this
+        is the same as find_stale().
+
+        Args:
+            root_dir: Path to scan
+            days: Number of days to consider stale
+
+        Returns:
+            List of RepoStatus for stale repos
+        """
+        if days < 1:
+            raise ValueError("days must be >= 1")
+        if self.backend == "pygit2":
+            return self.find_stale(root_dir, days)
+
+        root = self._resolve_root(root_dir)
+        now = datetime.now(timezone.utc)
+        repo_paths = self._find_repos(root)
+
+        statuses = self._map_repos(
+            lambda rp: self._get_last_commit(rp, now), repo_paths
+        )
+        return [r for r in statuses if r.last_commit_age_days > days]
 
     def find_unsynced(self, root_dir: str) -> List[RepoStatus]:
         """
@@ -566,8 +1313,7 @@ class GitPulse:
         Returns:
             List of RepoStatus for unsynced repos
         """
-        result = self.scan(root_dir)
-        return [r for r in result.repos if r.ahead > 0 or r.behind > 0]
+        return self.scan_filtered(root_dir, {"unsynced": _is_unsynced})["unsynced"]
 
     def find_no_remote(self, root_dir: str) -> List[RepoStatus]:
         """
@@ -579,8 +1325,9 @@ class GitPulse:
         Returns:
             List of RepoStatus for repos without remotes
         """
-        result = self.scan(root_dir)
-        return [r for r in result.repos if not r.has_remote]
+        return self.scan_filtered(
+            root_dir, {"no_remote": _has_no_remote}
+        )["no_remote"]
 
     def get_branches(self, repo_path: str) -> List[BranchInfo]:
         """
@@ -600,20 +1347,24 @@ class GitPulse:
             raise FileNotFoundError(f"Repository not found: {path}")
 
         branches = []
+        now = datetime.now(timezone.utc)
         stdout, _, rc = self._run_git(
             path, "branch", "-vv", "--format",
-            "%(HEAD)|||%(refname:short)|||%(upstream:short)|||%(upstream:track)"
+            # NUL-separated: unlike "|", it can't appear in a ref name
+            "%(HEAD)%00%(refname:short)%00%(upstream:short)%00%(upstream:track)"
+            "%00%(authordate:iso-strict)"
         )
         if rc != 0 or not stdout:
             return branches
 
         for line in stdout.split("\n"):
-            parts = line.split("|||")
+            parts = line.split("\0")
             if len(parts) >= 2:
                 is_current = parts[0].strip() == "*"
                 name = parts[1].strip()
                 tracking = parts[2].strip() if len(parts) > 2 else ""
                 track_info = parts[3].strip() if len(parts) > 3 else ""
+                commit_date = parts[4].strip() if len(parts) > 4 else ""
 
                 branch = BranchInfo(
                     name=name,
@@ -623,26 +1374,19 @@ class GitPulse:
 
                 # Parse ahead/behind from track info
                 if track_info:
-                    import re
-                    ahead_match = re.search(r"ahead (\d+)", track_info)
-                    behind_match = re.search(r"behind (\d+)", track_info)
-                    if ahead_match:
-                        branch.ahead = int(ahead_match.group(1))
-                    if behind_match:
-                        branch.behind = int(behind_match.group(1))
-
-                # Get last commit date for branch
-                stdout2, _, rc2 = self._run_git(
-                    path, "log", "-1", "--format=%aI", name
-                )
-                if rc2 == 0 and stdout2:
-                    branch.last_commit_date = stdout2
+                    track_match = _TRACK_RE.match(track_info)
+                    if track_match:
+                        ahead, behind = track_match.groups()
+                        if ahead:
+                            branch.ahead = int(ahead)
+                        if behind:
+                            branch.behind = int(behind)
+
+                # Last commit date (author date, same as `log --format=%aI`)
+                if commit_date:
+                    branch.last_commit_date = commit_date
                     try:
-                        commit_dt = datetime.fromisoformat(stdout2)
-                        now = datetime.now(timezone.utc)
-                        if commit_dt.tzinfo is None:
-                            commit_dt = commit_dt.replace(tzinfo=timezone.utc)
-                        delta = now - commit_dt
+                        delta = now - datetime.fromisoformat(commit_date)
                         branch.last_commit_age_days = delta.days
                     except (ValueError, TypeError):
                         pass
@@ -658,38 +1402,36 @@ class GitPulse:
 
 def format_text(result: ScanResult, verbose: bool = False) -> str:
     """Format scan result as plain text for terminal output."""
-    lines = []
-    lines.append("=" * 72)
-    lines.append("GITPULSE - Multi-Repository Health Monitor")
-    lines.append("=" * 72)
-    lines.append(f"  Scanned:   {result.root_dir}")
-    lines.append(f"  Time:      {result.scan_time}")
-    lines.append(f"  Duration:  {result.scan_duration_ms}ms")
-    lines.append(f"  Repos:     {result.total_repos}")
-    lines.append("")
-    lines.append(f"  [OK]  Healthy:   {result.healthy_count}")
-    lines.append(f"  [!]   Warning:   {result.warning_count}")
-    lines.append(f"  [X]   Critical:  {result.critical_count}")
+    lines = [
+        "=" * 72,
+        "GITPULSE - Multi-Repository Health Monitor",
+        "=" * 72,
+        f"  Scanned:   {result.root_dir}",
+        f"  Time:      {result.scan_time}",
+        f"  Duration:  {result.scan_duration_ms}ms",
+        f"  Repos:     {result.total_repos}",
+        "",
+        f"  [OK]  Healthy:   {result.healthy_count}",
+        f"  [!]   Warning:   {result.warning_count}",
+        f"  [X]   Critical:  {result.critical_count}",
+    ]
     if result.error_count > 0:
         lines.append(f"  [ERR] Errors:    {result.error_count}")
-    lines.append("")
-    lines.append("-" * 72)
+    lines.extend(("", "-" * 72))
 
     if not result.repos:
-        lines.append("  No git repositories found.")
-        lines.append("")
+        lines.extend(("  No git repositories found.", ""))
         return "\n".join(lines)
 
     # Header
-    lines.append(f"  {'REPO':<30} {'BRANCH':<15} {'GRADE':>5}  {'SCORE':>5}  STATUS")
-    lines.append("-" * 72)
+    lines.extend((
+        f"  {'REPO':<30} {'BRANCH':<15} {'GRADE':>5}  {'SCORE':>5}  STATUS",
+        "-" * 72,
+    ))
 
+    append = lines.append
     for repo in result.repos:
-        if repo.error:
-            grade_str = "ERR"
-        else:
-            grade_str = repo.health_grade
-
+        grade_str = "ERR" if repo.error else repo.health_grade
         branch_str = repo.current_branch[:14] if repo.current_branch else "n/a"
 
         # Status indicators
@@ -709,75 +1451,75 @@ def format_text(result: ScanResult, verbose: bool = False) -> str:
 
         status_str = ", ".join(status_parts) if status_parts else "clean"
 
-        lines.append(
+        append(
             f"  {repo.name:<30} {branch_str:<15} "
             f"{grade_str:>5}  {repo.health_score:>5}  {status_str}"
         )
 
-        if verbose and repo.issues:
+        if verbose:
             for issue in repo.issues:
-                lines.append(f"    -> {issue}")
+                append(f"    -> {issue}")
 
-    lines.append("-" * 72)
-    lines.append("")
+    lines.extend(("-" * 72, ""))
 
     # Summary stats
-    if result.repos:
-        avg_score = sum(r.health_score for r in result.repos) / len(result.repos)
-        lines.append(f"  Average Health Score: {avg_score:.0f}/100")
-        dirty_count = sum(1 for r in result.repos if r.is_dirty)
-        no_remote_count = sum(1 for r in result.repos if not r.has_remote)
-        if dirty_count > 0:
-            lines.append(f"  Repos with uncommitted changes: {dirty_count}")
-        if no_remote_count > 0:
-            lines.append(f"  Repos without remote: {no_remote_count}")
-        lines.append("")
+    avg_score = sum(r.health_score for r in result.repos) / len(result.repos)
+    lines.append(f"  Average Health Score: {avg_score:.0f}/100")
+    dirty_count = sum(1 for r in result.repos if r.is_dirty)
+    no_remote_count = sum(1 for r in result.repos if not r.has_remote)
+    if dirty_count > 0:
+        lines.append(f"  Repos with uncommitted changes: {dirty_count}")
+    if no_remote_count > 0:
+        lines.append(f"  Repos without remote: {no_remote_count}")
+    lines.append("")
 
     return "\n".join(lines)
 
 
 def format_repo_text(status: RepoStatus) -> str:
     """Format a single repo status as detailed text."""
-    lines = []
-    lines.append("=" * 60)
-    lines.append(f"  Repository: {status.name}")
-    lines.append("=" * 60)
-    lines.append(f"  Path:           {status.path}")
-    lines.append(f"  Branch:         {status.current_branch}")
-    lines.append(f"  Health:         {status.health_grade} ({status.health_score}/100)")
-    lines.append("")
-
-    lines.append("  --- Working Tree ---")
-    lines.append(f"  Staged:         {status.staged_count}")
-    lines.append(f"  Modified:       {status.modified_count}")
-    lines.append(f"  Untracked:      {status.untracked_count}")
-    lines.append(f"  Deleted:        {status.deleted_count}")
-    lines.append(f"  Conflicts:      {status.conflict_count}")
-    lines.append(f"  Dirty:          {'Yes' if status.is_dirty else 'No'}")
-    lines.append("")
-
-    lines.append("  --- Remote ---")
-    lines.append(f"  Has Remote:     {'Yes' if status.has_remote else 'No'}")
+    lines = [
+        "=" * 60,
+        f"  Repository: {status.name}",
+        "=" * 60,
+        f"  Path:           {status.path}",
+        f"  Branch:         {status.current_branch}",
+        f"  Health:         {status.health_grade} ({status.health_score}/100)",
+        "",
+        "  --- Working Tree ---",
+        f"  Staged:         {status.staged_count}",
+        f"  Modified:       {status.modified_count}",
+        f"  Untracked:      {status.untracked_count}",
+        f"  Deleted:        {status.deleted_count}",
+        f"  Conflicts:      {status.conflict_count}",
+        f"  Dirty:          {'Yes' if status.is_dirty else 'No'}",
+        "",
+        "  --- Remote ---",
+        f"  Has Remote:     {'Yes' if status.has_remote else 'No'}",
+    ]
     if status.remote_url:
         lines.append(f"  Remote URL:     {status.remote_url}")
-    lines.append(f"  Ahead:          {status.ahead}")
-    lines.append(f"  Behind:         {status.behind}")
-    lines.append("")
-
-    lines.append("  --- History ---")
-    lines.append(f"  Total Commits:  {status.total_commits}")
-    lines.append(f"  Last Commit:    {status.last_commit_date}")
+    total_commits = status.total_commits if status.total_commits >= 0 else "n/a"
+    lines.extend((
+        f"  Ahead:          {status.ahead}",
+        f"  Behind:         {status.behind}",
+        "",
+        "  --- History ---",
+        f"  Total Commits:  {total_commits}",
+        f"  Last Commit:    {status.last_commit_date}",
+    ))
     if status.last_commit_age_days > 0:
         lines.append(f"  Commit Age:     {status.last_commit_age_days} day(s)")
     if status.last_commit_message:
         lines.append(f"  Message:        {status.last_commit_message}")
-    lines.append("")
-
-    lines.append("  --- Stats ---")
-    lines.append(f"  Branches:       {status.branch_count}")
-    lines.append(f"  Tags:           {status.tag_count}")
-    lines.append(f"  Stashes:        {status.stash_count}")
-    lines.append("")
+    lines.extend((
+        "",
+        "  --- Stats ---",
+        f"  Branches:       {status.branch_count}",
+        f"  Tags:           {status.tag_count}",
+        f"  Stashes:        {status.stash_count}",
+        "",
+    ))
 
     if status.issues:
         lines.append("  --- Issues ---")
@@ -786,49 +1528,75 @@ def format_repo_text(status: RepoStatus) -> str:
         lines.append("")
 
     if status.error:
-        lines.append(f"  [X] ERROR: {status.error}")
-        lines.append("")
+        lines.extend((f"  [X] ERROR: {status.error}", ""))
 
     return "\n".join(lines)
 
 
-def format_json(result: ScanResult) -> str:
-    """Format scan result as JSON."""
-    return json.dumps(result.to_dict(), indent=2, default=str)
+def format_json(result: ScanResult, indent: Optional[int] = 2) -> str:
+    """
+    Format scan result as JSON.
+
+    Args:
+        result: ScanResult to format
+        indent: Spaces per nesting level, or None for compact output
+            without any whitespace
+    """
+    data = result.to_dict()
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent == 2 else None
+        return orjson.dumps(data, option=option, default=str).decode("utf-8")
+    if indent is None:
+        return json.dumps(data, separators=(",", ":"), default=str)
+    return json.dumps(data, indent=indent, default=str)
+
+
+def _dump_json(data, fp) -> None:
+    """Write ``data`` as indented JSON to ``fp``, via orjson when available."""
+    if orjson is not None:
+        fp.write(orjson.dumps(
+            data, option=orjson.OPT_INDENT_2, default=str
+        ).decode("utf-8"))
+    else:
+        # Streams chunks into fp instead of building the whole string
+        json.dump(data, fp, indent=2, default=str)
+    fp.write("\n")
 
 
 def format_markdown(result: ScanResult) -> str:
     """Format scan result as Markdown."""
-    lines = []
-    lines.append("# GitPulse Health Report")
-    lines.append("")
-    lines.append(f"**Scanned:** `{result.root_dir}`  ")
-    lines.append(f"**Time:** {result.scan_time}  ")
-    lines.append(f"**Duration:** {result.scan_duration_ms}ms  ")
-    lines.append(f"**Total Repos:** {result.total_repos}")
-    lines.append("")
-
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"| Status | Count |")
-    lines.append(f"|--------|-------|")
-    lines.append(f"| Healthy (80+) | {result.healthy_count} |")
-    lines.append(f"| Warning (60-79) | {result.warning_count} |")
-    lines.append(f"| Critical (<60) | {result.critical_count} |")
+    lines = [
+        "# GitPulse Health Report",
+        "",
+        f"**Scanned:** `{result.root_dir}`  ",
+        f"**Time:** {result.scan_time}  ",
+        f"**Duration:** {result.scan_duration_ms}ms  ",
+        f"**Total Repos:** {result.total_repos}",
+        "",
+        "## Summary",
+        "",
+        "| Status | Count |",
+        "|--------|-------|",
+        f"| Healthy (80+) | {result.healthy_count} |",
+        f"| Warning (60-79) | {result.warning_count} |",
+        f"| Critical (<60) | {result.critical_count} |",
+    ]
     if result.error_count > 0:
         lines.append(f"| Errors | {result.error_count} |")
     lines.append("")
 
     if result.repos:
         avg_score = sum(r.health_score for r in result.repos) / len(result.repos)
-        lines.append(f"**Average Health Score:** {avg_score:.0f}/100")
-        lines.append("")
+        lines.extend((f"**Average Health Score:** {avg_score:.0f}/100", ""))
 
-    lines.append("## Repository Details")
-    lines.append("")
-    lines.append("| Repo | Branch | Grade | Score | Status |")
-    lines.append("|------|--------|-------|-------|--------|")
+    lines.extend((
+        "## Repository Details",
+        "",
+        "| Repo | Branch | Grade | Score | Status |",
+        "|------|--------|-------|-------|--------|",
+    ))
 
+    append = lines.append
     for repo in result.repos:
         status_parts = []
         if repo.is_dirty:
@@ -844,7 +1612,7 @@ def format_markdown(result: ScanResult) -> str:
         status_str = ", ".join(status_parts) if status_parts else "clean"
 
         branch = repo.current_branch if repo.current_branch else "n/a"
-        lines.append(
+        append(
             f"| {repo.name} | {branch} | {repo.health_grade} | "
             f"{repo.health_score} | {status_str} |"
         )
@@ -854,30 +1622,29 @@ def format_markdown(result: ScanResult) -> str:
     # Issues section
     repos_with_issues = [r for r in result.repos if r.issues]
     if repos_with_issues:
-        lines.append("## Issues Requiring Attention")
-        lines.append("")
+        lines.extend(("## Issues Requiring Attention", ""))
         for repo in repos_with_issues:
-            lines.append(f"### {repo.name} ({repo.health_grade} - {repo.health_score}/100)")
+            append(f"### {repo.name} ({repo.health_grade} - {repo.health_score}/100)")
             for issue in repo.issues:
-                lines.append(f"- {issue}")
-            lines.append("")
+                append(f"- {issue}")
+            append("")
 
-    lines.append("---")
-    lines.append(f"*Generated by GitPulse v{__version__}*")
-    lines.append("")
+    lines.extend(("---", f"*Generated by GitPulse v{__version__}*", ""))
 
     return "\n".join(lines)
 
 
 def format_branches_text(branches: List[BranchInfo], repo_name: str) -> str:
     """Format branch information as text."""
-    lines = []
-    lines.append("=" * 60)
-    lines.append(f"  Branches: {repo_name}")
-    lines.append("=" * 60)
-    lines.append(f"  {'BRANCH':<25} {'TRACKING':<25} {'AGE':>8}  SYNC")
-    lines.append("-" * 60)
-
+    lines = [
+        "=" * 60,
+        f"  Branches: {repo_name}",
+        "=" * 60,
+        f"  {'BRANCH':<25} {'TRACKING':<25} {'AGE':>8}  SYNC",
+        "-" * 60,
+    ]
+
+    append = lines.append
     for b in branches:
         marker = "* " if b.is_current else "  "
         tracking = b.tracking if b.tracking else "(none)"
@@ -890,13 +1657,11 @@ def format_branches_text(branches: List[BranchInfo], repo_name: str) -> str:
             sync_parts.append(f"-{b.behind}")
         sync_str = ", ".join(sync_parts) if sync_parts else "synced"
 
-        lines.append(
+        append(
             f"  {marker}{b.name:<23} {tracking:<25} {age_str:>8}  {sync_str}"
         )
 
-    lines.append("-" * 60)
-    lines.append(f"  Total branches: {len(branches)}")
-    lines.append("")
+    lines.extend(("-" * 60, f"  Total branches: {len(branches)}", ""))
 
     return "\n".join(lines)
 
@@ -905,15 +1670,78 @@ def format_branches_text(branches: List[BranchInfo], repo_name: str) -> str:
 # CLI Interface
 # ---------------------------------------------------------------------------
 
-def main():
-    """CLI entry point for GitPulse."""
-    # Fix Windows console encoding
-    if sys.platform == "win32":
-        try:
-            sys.stdout.reconfigure(encoding="utf-8")
-        except AttributeError:
-            pass
+def _format_dirty_text(dirty_repos: List[RepoStatus]) -> str:
+    """Format the dirty-repo listing used by the dirty and triage commands."""
+    if not dirty_repos:
+        return "[OK] All repositories are clean!"
+    lines = [f"[!] Found {len(dirty_repos)} dirty repo(s):", ""]
+    append = lines.append
+    for r in dirty_repos:
+        parts = []
+        if r.staged_count:
+            parts.append(f"{r.staged_count} staged")
+        if r.modified_count:
+            parts.append(f"{r.modified_count} modified")
+        if r.untracked_count:
+            parts.append(f"{r.untracked_count} untracked")
+        if r.deleted_count:
+            parts.append(f"{r.deleted_count} deleted")
+        detail = ", ".join(parts)
+        append(f"  {r.name:<35} ({detail})")
+    append("")
+    return "\n".join(lines)
+
+
+def _format_stale_text(stale_repos: List[RepoStatus], days: int) -> str:
+    """Format the stale-repo listing used by the stale and triage commands."""
+    if not stale_repos:
+        return f"[OK] No repos stale (>{days} days)."
+    lines = [
+        f"[!] Found {len(stale_repos)} stale repo(s) (>{days} days):",
+        "",
+    ]
+    append = lines.append
+    for r in stale_repos:
+        append(
+            f"  {r.name:<35} "
+            f"{r.last_commit_age_days} days ago"
+        )
+    append("")
+    return "\n".join(lines)
+
+
+def _format_sync_text(unsynced: List[RepoStatus],
+                      no_remote: List[RepoStatus]) -> str:
+    """Format the sync listing used by the sync and triage commands."""
+    if not unsynced and not no_remote:
+        return "[OK] All repositories are in sync!"
+    lines = []
+    append = lines.append
+    if unsynced:
+        lines.extend((f"[!] {len(unsynced)} repo(s) out of sync:", ""))
+        for r in unsynced:
+            sync_parts = []
+            if r.ahead > 0:
+                sync_parts.append(f"+{r.ahead} ahead")
+            if r.behind > 0:
+                sync_parts.append(f"-{r.behind} behind")
+            sync_str = ", ".join(sync_parts)
+            append(f"  {r.name:<35} {sync_str}")
+        append("")
+    if no_remote:
+        lines.extend((f"[!] {len(no_remote)} repo(s) have no remote:", ""))
+        for r in no_remote:
+            append(f"  {r.name}")
+        append("")
+    return "\n".join(lines)
+
+
+# argparse parser for main(), built on first use
+_PARSER: Optional[argparse.ArgumentParser] = None
+
 
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(
         prog="gitpulse",
         description="GitPulse - Multi-Repository Health Monitor",
@@ -926,6 +1754,7 @@ Examples:
   %(prog)s dirty .                    Find repos with uncommitted changes
   %(prog)s stale . --days 60          Find repos inactive for 60+ days
   %(prog)s sync .                     Find repos ahead/behind remote
+  %(prog)s triage .                   Dirty, stale and sync in one pass
   %(prog)s branches ./MyRepo          Show branch details for a repo
   %(prog)s report . --format md       Generate Markdown health report
 
@@ -937,11 +1766,46 @@ For more information: https://github.com/DonkRonk17/GitPulse
         "--version", action="version", version=f"%(prog)s {__version__}"
     )
 
+    # Options shared by every command that analyzes repos
+    repo_opts = argparse.ArgumentParser(add_help=False)
+    repo_opts.add_argument(
+        "--backend", choices=["git", "pygit2"], default="git",
+        help="Repo reader: git CLI (default) or pygit2 if installed"
+    )
+    repo_opts.add_argument(
+        "--no-cache", action="store_true",
+        help="Don't reuse or save cached git metadata between runs"
+    )
+
+    # Options shared by the commands that scan a directory tree
+    scan_opts = argparse.ArgumentParser(add_help=False, parents=[repo_opts])
+    scan_opts.add_argument(
+        "--depth", "-d", type=int, default=3,
+        help="Max directory depth to search (default: 3)"
+    )
+    scan_opts.add_argument(
+        "--ignore-symlinks", action="store_true",
+        help="Don't follow symlinked directories"
+    )
+    scan_opts.add_argument(
+        "--exact-commit-count", action="store_true",
+        help="Count every commit per repo (slow on large histories)"
+    )
+    scan_opts.add_argument(
+        "--exclude", action="append", default=[], metavar="NAME",
+        help="Also skip directories with this name (repeatable)"
+    )
+    scan_opts.add_argument(
+        "--workers", "-j", type=int, default=None,
+        help="Repos to analyze concurrently (default: min(32, 4 x CPUs))"
+    )
+
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # scan
     scan_parser = subparsers.add_parser(
-        "scan", help="Scan directory for repos and show health summary"
+        "scan", parents=[scan_opts],
+        help="Scan directory for repos and show health summary"
     )
     scan_parser.add_argument("path", help="Directory to scan")
     scan_parser.add_argument(
@@ -952,10 +1816,6 @@ For more information: https://github.com/DonkRonk17/GitPulse
         "--format", "-f", choices=["text", "json", "md"],
         default="text", help="Output format (default: text)"
     )
-    scan_parser.add_argument(
-        "--depth", "-d", type=int, default=3,
-        help="Max directory depth to search (default: 3)"
-    )
     scan_parser.add_argument(
         "--sort", "-s", choices=["name", "score", "age"],
         default="score", help="Sort repos by (default: score)"
@@ -963,7 +1823,8 @@ For more information: https://github.com/DonkRonk17/GitPulse
 
     # status
     status_parser = subparsers.add_parser(
-        "status", help="Detailed status for a specific repo"
+        "status", parents=[repo_opts],
+        help="Detailed status for a specific repo"
     )
     status_parser.add_argument("path", help="Path to git repository")
     status_parser.add_argument(
@@ -973,21 +1834,19 @@ For more information: https://github.com/DonkRonk17/GitPulse
 
     # dirty
     dirty_parser = subparsers.add_parser(
-        "dirty", help="Find repos with uncommitted changes"
+        "dirty", parents=[scan_opts],
+        help="Find repos with uncommitted changes"
     )
     dirty_parser.add_argument("path", help="Directory to scan")
     dirty_parser.add_argument(
         "--format", "-f", choices=["text", "json"],
         default="text", help="Output format"
     )
-    dirty_parser.add_argument(
-        "--depth", "-d", type=int, default=3,
-        help="Max directory depth to search"
-    )
 
     # stale
     stale_parser = subparsers.add_parser(
-        "stale", help="Find repos with no recent commits"
+        "stale", parents=[scan_opts],
+        help="Find repos with no recent commits"
     )
     stale_parser.add_argument("path", help="Directory to scan")
     stale_parser.add_argument(
@@ -998,23 +1857,31 @@ For more information: https://github.com/DonkRonk17/GitPulse
         "--format", "-f", choices=["text", "json"],
         default="text", help="Output format"
     )
-    stale_parser.add_argument(
-        "--depth", "-d", type=int, default=3,
-        help="Max directory depth to search"
-    )
 
     # sync
     sync_parser = subparsers.add_parser(
-        "sync", help="Find repos ahead/behind remote"
+        "sync", parents=[scan_opts],
+        help="Find repos ahead/behind remote"
     )
     sync_parser.add_argument("path", help="Directory to scan")
     sync_parser.add_argument(
         "--format", "-f", choices=["text", "json"],
         default="text", help="Output format"
     )
-    sync_parser.add_argument(
-        "--depth", "-d", type=int, default=3,
-        help="Max directory depth to search"
+
+    # triage
+    triage_parser = subparsers.add_parser(
+        "triage", parents=[scan_opts],
+        help="Dirty, stale and sync checks from a single scan"
+    )
+    triage_parser.add_argument("path", help="Directory to scan")
+    triage_parser.add_argument(
+        "--days", type=int, default=30,
+        help="Stale threshold in days (default: 30)"
+    )
+    triage_parser.add_argument(
+        "--format", "-f", choices=["text", "json"],
+        default="text", help="Output format"
     )
 
     # branches
@@ -1029,7 +1896,8 @@ For more information: https://github.com/DonkRonk17/GitPulse
 
     # report
     report_parser = subparsers.add_parser(
-        "report", help="Generate comprehensive health report"
+        "report", parents=[scan_opts],
+        help="Generate comprehensive health report"
     )
     report_parser.add_argument("path", help="Directory to scan")
     report_parser.add_argument(
@@ -1039,12 +1907,40 @@ For more information: https://github.com/DonkRonk17/GitPulse
     report_parser.add_argument(
         "--output", "-o", help="Save report to file"
     )
-    report_parser.add_argument(
-        "--depth", "-d", type=int, default=3,
-        help="Max directory depth to search"
-    )
 
-    args = parser.parse_args()
+    return parser
+
+
+def _fix_console() -> None:
+    """Switch a non-UTF-8 Windows console to UTF-8 (no-op elsewhere)."""
+    if sys.platform != "win32":
+        return
+    # Already UTF-8 (PYTHONUTF8, PYTHONIOENCODING, or an earlier call):
+    # leave the stream alone
+    encoding = (getattr(sys.stdout, "encoding", None) or "").lower()
+    if encoding.replace("-", "") == "utf8":
+        return
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except AttributeError:
+        pass
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    CLI entry point for GitPulse.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    """
+    global _PARSER
+
+    _fix_console()
+
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    parser = _PARSER
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
@@ -1066,10 +1962,34 @@ For more information: https://github.com/DonkRonk17/GitPulse
         return 1
 
 
+def _default_cache_dir() -> str:
+    """Per-user cache directory for the CLI's persisted git metadata."""
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        base = os.environ["LOCALAPPDATA"]
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+    return os.path.join(base, "gitpulse")
+
+
 def _handle_command(args) -> int:
     """Handle CLI commands."""
     depth = getattr(args, "depth", 3)
-    pulse = GitPulse(max_depth=depth)
+    pulse = GitPulse(
+        max_depth=depth,
+        max_workers=getattr(args, "workers", None),
+        skip_dirs=_SKIP_DIRS.union(getattr(args, "exclude", ())),
+        ignore_symlinks=getattr(args, "ignore_symlinks", False),
+        backend=getattr(args, "backend", "git"),
+        cache_dir=None if getattr(args, "no_cache", False) else _default_cache_dir(),
+        # Multi-repo commands skip the history walk unless asked; `status`
+        # reports on one repo and always counts.
+        exact_commit_count=(
+            args.command == "status"
+            or getattr(args, "exact_commit_count", False)
+        ),
+    )
     fmt = getattr(args, "format", "text")
 
     if args.command == "scan":
@@ -1077,7 +1997,7 @@ def _handle_command(args) -> int:
         if args.sort == "name":
             result.repos.sort(key=lambda r: r.name.lower())
         elif args.sort == "age":
-            result.repos.sort(key=lambda r: -r.last_commit_age_days)
+            result.repos.sort(key=attrgetter("last_commit_age_days"), reverse=True)
         # default sort by score is already done
 
         if fmt == "json":
@@ -1090,104 +2010,96 @@ def _handle_command(args) -> int:
     elif args.command == "status":
         status = pulse.get_status(args.path)
         if fmt == "json":
-            print(json.dumps(status.to_dict(), indent=2, default=str))
+            _dump_json(status.to_dict(), sys.stdout)
         else:
             print(format_repo_text(status))
 
     elif args.command == "dirty":
-        result = pulse.scan(args.path)
-        dirty_repos = [r for r in result.repos if r.is_dirty]
+        dirty_repos = pulse.find_dirty(args.path)
         if fmt == "json":
-            print(json.dumps(
-                [r.to_dict() for r in dirty_repos], indent=2, default=str
-            ))
+            _dump_json([r.to_dict() for r in dirty_repos], sys.stdout)
         else:
-            if not dirty_repos:
-                print("[OK] All repositories are clean!")
-            else:
-                print(f"[!] Found {len(dirty_repos)} dirty repo(s):")
-                print("")
-                for r in dirty_repos:
-                    parts = []
-                    if r.staged_count:
-                        parts.append(f"{r.staged_count} staged")
-                    if r.modified_count:
-                        parts.append(f"{r.modified_count} modified")
-                    if r.untracked_count:
-                        parts.append(f"{r.untracked_count} untracked")
-                    if r.deleted_count:
-                        parts.append(f"{r.deleted_count} deleted")
-                    detail = ", ".join(parts)
-                    print(f"  {r.name:<35} ({detail})")
-                print("")
+            print(_format_dirty_text(dirty_repos))
 
     elif args.command == "stale":
         days = args.days
-        result = pulse.scan(args.path)
-        stale_repos = [r for r in result.repos if r.last_commit_age_days > days]
-        stale_repos.sort(key=lambda r: -r.last_commit_age_days)
         if fmt == "json":
-            print(json.dumps(
-                [r.to_dict() for r in stale_repos], indent=2, default=str
-            ))
+            stale_repos = pulse.find_stale(args.path, days)
         else:
-            if not stale_repos:
-                print(f"[OK] No repos stale (>{days} days).")
-            else:
-                print(f"[!] Found {len(stale_repos)} stale repo(s) (>{days} days):")
-                print("")
-                for r in stale_repos:
-                    print(
-                        f"  {r.name:<35} "
-                        f"{r.last_commit_age_days} days ago"
-                    )
-                print("")
+            # The text listing only needs commit ages
+            stale_repos = pulse.find_stale_fast(args.path, days)
+        stale_repos.sort(key=attrgetter("last_commit_age_days"), reverse=True)
+        if fmt == "json":
+            _dump_json([r.to_dict() for r in stale_repos], sys.stdout)
+        else:
+            print(_format_stale_text(stale_repos, days))
 
     elif args.command == "sync":
-        result = pulse.scan(args.path)
-        unsynced = [r for r in result.repos if r.ahead > 0 or r.behind > 0]
-        no_remote = [r for r in result.repos if not r.has_remote]
+        groups = pulse.scan_filtered(args.path, {
+            "unsynced": _is_unsynced,
+            "no_remote": _has_no_remote,
+        })
+        unsynced = groups["unsynced"]
+        no_remote = groups["no_remote"]
         if fmt == "json":
             data = {
                 "unsynced": [r.to_dict() for r in unsynced],
                 "no_remote": [r.to_dict() for r in no_remote],
             }
-            print(json.dumps(data, indent=2, default=str))
+            _dump_json(data, sys.stdout)
         else:
-            if not unsynced and not no_remote:
-                print("[OK] All repositories are in sync!")
-            else:
-                if unsynced:
-                    print(f"[!] {len(unsynced)} repo(s) out of sync:")
-                    print("")
-                    for r in unsynced:
-                        sync_parts = []
-                        if r.ahead > 0:
-                            sync_parts.append(f"+{r.ahead} ahead")
-                        if r.behind > 0:
-                            sync_parts.append(f"-{r.behind} behind")
-                        sync_str = ", ".join(sync_parts)
-                        print(f"  {r.name:<35} {sync_str}")
-                    print("")
-                if no_remote:
-                    print(f"[!] {len(no_remote)} repo(s) have no remote:")
-                    print("")
-                    for r in no_remote:
-                        print(f"  {r.name}")
-                    print("")
+            print(_format_sync_text(unsynced, no_remote))
+
+    elif args.command == "triage":
+        # dirty + stale + sync from a single scan
+        days = args.days
+        if days < 1:
+            raise ValueError("days must be >= 1")
+        groups = pulse.scan_filtered(args.path, {
+            "dirty": _is_dirty,
+            "stale": lambda r: r.last_commit_age_days > days,
+            "unsynced": _is_unsynced,
+            "no_remote": _has_no_remote,
+        })
+        dirty_repos = groups["dirty"]
+        stale_repos = groups["stale"]
+        stale_repos.sort(key=attrgetter("last_commit_age_days"), reverse=True)
+        unsynced = groups["unsynced"]
+        no_remote = groups["no_remote"]
+        if fmt == "json":
+            data = {
+                "dirty": [r.to_dict() for r in dirty_repos],
+                "stale": [r.to_dict() for r in stale_repos],
+                "unsynced": [r.to_dict() for r in unsynced],
+                "no_remote": [r.to_dict() for r in no_remote],
+            }
+            _dump_json(data, sys.stdout)
+        else:
+            print("\n\n".join((
+                _format_dirty_text(dirty_repos).rstrip("\n"),
+                _format_stale_text(stale_repos, days).rstrip("\n"),
+                _format_sync_text(unsynced, no_remote).rstrip("\n"),
+            )))
+            print("")
 
     elif args.command == "branches":
         branches = pulse.get_branches(args.path)
-        repo_name = Path(args.path).resolve().name
+        repo_name = os.path.basename(os.path.abspath(args.path))
         if fmt == "json":
-            print(json.dumps(
-                [asdict(b) for b in branches], indent=2, default=str
-            ))
+            _dump_json([b.to_dict() for b in branches], sys.stdout)
         else:
             print(format_branches_text(branches, repo_name))
 
     elif args.command == "report":
         result = pulse.scan(args.path)
+        if fmt == "json" and args.output:
+            # Serialize straight into the file rather than via a string
+            output_path = Path(args.output)
+            with output_path.open("w", encoding="utf-8") as fp:
+                _dump_json(result.to_dict(), fp)
+            print(f"[OK] Report saved to: {output_path}")
+            return 0
+
         if fmt == "json":
             output = format_json(result)
         elif fmt == "md":
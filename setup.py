@@ -18,6 +18,10 @@ setup(
     py_modules=["gitpulse"],
     python_requires=">=3.7",
     install_requires=[],
+    extras_require={
+        "fast": ["orjson"],
+        "pygit2": ["pygit2"],
+    },
     entry_points={
         "console_scripts": [
             "gitpulse=gitpulse:main",
@@ -14,6 +14,8 @@ Tests cover:
 Run: python test_gitpulse.py
 """
 
+import dataclasses
+import io
 import json
 import os
 import shutil
@@ -21,12 +23,14 @@ import subprocess
 import sys
 import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+import gitpulse
 from gitpulse import (
     GitPulse,
     BranchInfo,
@@ -55,6 +59,26 @@ class TestGitPulseInit(unittest.TestCase):
         self.assertEqual(pulse.max_depth, 5)
         self.assertEqual(pulse.timeout, 30)
 
+    def test_max_workers(self):
+        """Test max_workers default and override."""
+        self.assertGreaterEqual(GitPulse().max_workers, 1)
+        self.assertEqual(GitPulse(max_workers=4).max_workers, 4)
+
+    def test_invalid_max_workers(self):
+        """Test that invalid max_workers raises ValueError."""
+        with self.assertRaises(ValueError):
+            GitPulse(max_workers=0)
+
+    def test_invalid_backend(self):
+        """Test that an unknown backend raises ValueError."""
+        with self.assertRaises(ValueError):
+            GitPulse(backend="svn")
+
+    def test_invalid_scan_ttl(self):
+        """Test that a negative scan_ttl raises ValueError."""
+        with self.assertRaises(ValueError):
+            GitPulse(scan_ttl=-1)
+
     def test_invalid_max_depth(self):
         """Test that invalid max_depth raises ValueError."""
         with self.assertRaises(ValueError):
@@ -96,6 +120,21 @@ class TestRepoStatus(unittest.TestCase):
         self.assertEqual(d["path"], "/tmp/test")
         self.assertEqual(d["health_score"], 100)
 
+    def test_to_dict_covers_all_fields(self):
+        """Test that to_dict includes every field, in declaration order."""
+        for obj in (RepoStatus(name="t", path="/t"), BranchInfo(name="m"),
+                    ScanResult(root_dir="/t", scan_time="now")):
+            self.assertEqual(
+                list(obj.to_dict()),
+                [f.name for f in dataclasses.fields(obj)],
+            )
+
+    def test_to_dict_copies_issues(self):
+        """Test that to_dict doesn't share the issues list."""
+        status = RepoStatus(name="t", path="/t", issues=["x"])
+        status.to_dict()["issues"].append("y")
+        self.assertEqual(status.issues, ["x"])
+
     def test_dirty_detection(self):
         """Test that is_dirty field works."""
         status = RepoStatus(name="test", path="/tmp/test", is_dirty=True)
@@ -240,6 +279,15 @@ class TestHealthScoring(unittest.TestCase):
         _, grade2, _ = pulse._calculate_health(s2)
         self.assertEqual(grade2, "B")
 
+    def test_grade_table_thresholds(self):
+        """Test the score -> grade table at each grade cutoff."""
+        grades = gitpulse._GRADE_BY_SCORE
+        self.assertEqual(len(grades), 101)
+        for score, grade in ((0, "F"), (59, "F"), (60, "D"), (69, "D"),
+                             (70, "C"), (79, "C"), (80, "B"), (89, "B"),
+                             (90, "A"), (100, "A")):
+            self.assertEqual(grades[score], grade)
+
     def test_multiple_issues_compound(self):
         """Test that multiple issues compound deductions."""
         status = RepoStatus(
@@ -280,31 +328,51 @@ class TestHealthScoring(unittest.TestCase):
 class TestGitPulseWithRealRepos(unittest.TestCase):
     """Test GitPulse with real temporary git repositories."""
 
-    def setUp(self):
-        """Create temporary directory structure with git repos."""
-        self.test_dir = tempfile.mkdtemp(prefix="gitpulse_test_")
-        self.pulse = GitPulse(max_depth=3)
+    @classmethod
+    def setUpClass(cls):
+        """Build the fixture repos once; each test gets a fresh copy."""
+        cls.template_dir = tempfile.mkdtemp(prefix="gitpulse_template_")
+        template = Path(cls.template_dir)
 
         # Create a clean repo
-        self.clean_repo = Path(self.test_dir) / "clean_repo"
-        self.clean_repo.mkdir()
-        self._init_repo(self.clean_repo)
-        self._make_commit(self.clean_repo, "Initial commit")
+        clean_repo = template / "clean_repo"
+        clean_repo.mkdir()
+        cls._init_repo(clean_repo)
+        cls._make_commit(clean_repo, "Initial commit")
 
         # Create a dirty repo
-        self.dirty_repo = Path(self.test_dir) / "dirty_repo"
-        self.dirty_repo.mkdir()
-        self._init_repo(self.dirty_repo)
-        self._make_commit(self.dirty_repo, "Initial commit")
+        dirty_repo = template / "dirty_repo"
+        dirty_repo.mkdir()
+        cls._init_repo(dirty_repo)
+        cls._make_commit(dirty_repo, "Initial commit")
         # Add untracked file
-        (self.dirty_repo / "untracked.txt").write_text("hello")
+        (dirty_repo / "untracked.txt").write_text("hello")
         # Modify tracked file
-        (self.dirty_repo / "readme.txt").write_text("modified content")
+        (dirty_repo / "readme.txt").write_text("modified content")
 
         # Create a non-git directory
+        non_git = template / "not_a_repo"
+        non_git.mkdir()
+        (non_git / "file.txt").write_text("just a file")
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the fixture template."""
+        shutil.rmtree(cls.template_dir, ignore_errors=True)
+
+    def setUp(self):
+        """Copy the fixture repos into a fresh temporary directory."""
+        self.test_dir = tempfile.mkdtemp(prefix="gitpulse_test_")
+        self.pulse = GitPulse(max_depth=3)
+        for name in os.listdir(self.template_dir):
+            shutil.copytree(
+                os.path.join(self.template_dir, name),
+                os.path.join(self.test_dir, name),
+                symlinks=True,
+            )
+        self.clean_repo = Path(self.test_dir) / "clean_repo"
+        self.dirty_repo = Path(self.test_dir) / "dirty_repo"
         self.non_git = Path(self.test_dir) / "not_a_repo"
-        self.non_git.mkdir()
-        (self.non_git / "file.txt").write_text("just a file")
 
     def tearDown(self):
         """Clean up temporary directory."""
@@ -313,32 +381,45 @@ class TestGitPulseWithRealRepos(unittest.TestCase):
         except Exception:
             pass
 
-    def _init_repo(self, path: Path):
+    @staticmethod
+    def _init_repo(path: Path):
         """Initialize a git repository."""
         subprocess.run(
             ["git", "init"], cwd=str(path),
-            capture_output=True, text=True
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
         subprocess.run(
             ["git", "config", "user.email", "test@test.com"],
-            cwd=str(path), capture_output=True, text=True
+            cwd=str(path),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
         subprocess.run(
             ["git", "config", "user.name", "Test"],
-            cwd=str(path), capture_output=True, text=True
+            cwd=str(path),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+    @staticmethod
+    def _git(path, *args, env=None):
+        """Run a git command in path, discarding its output."""
+        subprocess.run(
+            ["git", *args], cwd=str(path), env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
 
-    def _make_commit(self, path: Path, message: str):
+    @staticmethod
+    def _make_commit(path: Path, message: str):
         """Create a file and commit it."""
         readme = path / "readme.txt"
         readme.write_text(f"Content for {message}")
         subprocess.run(
             ["git", "add", "."], cwd=str(path),
-            capture_output=True, text=True
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
         subprocess.run(
             ["git", "commit", "-m", message],
-            cwd=str(path), capture_output=True, text=True
+            cwd=str(path),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
 
     def test_scan_finds_repos(self):
@@ -355,6 +436,33 @@ class TestGitPulseWithRealRepos(unittest.TestCase):
         repo_names = {r.name for r in result.repos}
         self.assertNotIn("not_a_repo", repo_names)
 
+    def test_find_repos_depth_and_skip_dirs(self):
+        """Test that discovery honors max_depth and skipped directories."""
+        for rel in ("a/b/c/deep_repo", "node_modules/dep_repo"):
+            (Path(self.test_dir) / rel / ".git").mkdir(parents=True)
+        found = {p.name for p in GitPulse(max_depth=3)._find_repos(
+            Path(self.test_dir))}
+        self.assertEqual(found, {"clean_repo", "dirty_repo"})
+        found = {p.name for p in GitPulse(max_depth=4)._find_repos(
+            Path(self.test_dir))}
+        self.assertIn("deep_repo", found)
+        self.assertNotIn("dep_repo", found)
+        found = {p.name for p in GitPulse(max_depth=4, skip_dirs={"a"})._find_repos(
+            Path(self.test_dir))}
+        self.assertIn("dep_repo", found)
+        self.assertNotIn("deep_repo", found)
+
+    @unittest.skipIf(sys.platform == "win32", "symlinks need privileges")
+    def test_find_repos_ignore_symlinks(self):
+        """Test that symlinked directories can be skipped."""
+        link_root = Path(self.test_dir) / "links"
+        link_root.mkdir()
+        os.symlink(str(self.clean_repo), str(link_root / "linked_repo"))
+        found = {p.name for p in GitPulse()._find_repos(link_root)}
+        self.assertEqual(found, {"linked_repo"})
+        found = GitPulse(ignore_symlinks=True)._find_repos(link_root)
+        self.assertEqual(found, [])
+
     def test_clean_repo_status(self):
         """Test status of clean repository."""
         status = self.pulse.get_status(str(self.clean_repo))
@@ -364,6 +472,34 @@ class TestGitPulseWithRealRepos(unittest.TestCase):
         self.assertEqual(status.modified_count, 0)
         self.assertGreater(status.total_commits, 0)
 
+    def test_parallel_queries_match_sequential(self):
+        """Test that prefetching queries doesn't change the status."""
+        for repo in (self.clean_repo, self.dirty_repo):
+            sequential = GitPulse()._get_repo_status(repo)
+            parallel = GitPulse()._get_repo_status(repo, parallel_queries=True)
+            self.assertEqual(sequential.to_dict(), parallel.to_dict())
+
+    def test_status_from_subdirectory(self):
+        """Test that get_status on a path inside a repo reads the repo."""
+        subdir = self.clean_repo / "src"
+        subdir.mkdir()
+        (subdir / "main.py").write_text("print('hi')")
+        self._git(self.clean_repo, "add", ".")
+        self._git(self.clean_repo, "commit", "-m", "Add src")
+        top = self.pulse.get_status(str(self.clean_repo))
+        inner = self.pulse.get_status(str(subdir))
+        self.assertEqual(inner.total_commits, 2)
+        self.assertEqual(inner.branch_count, top.branch_count)
+        self.assertEqual(inner.last_commit_message, "Add src")
+        self.assertEqual(inner.health_score, top.health_score)
+
+    def test_skip_commit_count(self):
+        """Test that commit counting can be skipped."""
+        pulse = GitPulse(exact_commit_count=False)
+        status = pulse.get_status(str(self.clean_repo))
+        self.assertEqual(status.total_commits, -1)
+        self.assertNotIn("No commits yet", status.issues)
+
     def test_dirty_repo_status(self):
         """Test status of dirty repository."""
         status = self.pulse.get_status(str(self.dirty_repo))
@@ -371,12 +507,179 @@ class TestGitPulseWithRealRepos(unittest.TestCase):
         self.assertTrue(status.is_dirty)
         self.assertGreater(status.untracked_count, 0)
 
+    def test_staged_and_deleted_counts(self):
+        """Test staged, modified and deleted file counting."""
+        (self.clean_repo / "new.txt").write_text("new")
+        self._git(self.clean_repo, "add", "new.txt")
+        (self.clean_repo / "new.txt").write_text("new, then edited")
+        (self.clean_repo / "readme.txt").unlink()
+        status = self.pulse.get_status(str(self.clean_repo))
+        self.assertEqual(status.staged_count, 1)
+        self.assertEqual(status.modified_count, 1)
+        self.assertEqual(status.deleted_count, 1)
+        self.assertEqual(status.untracked_count, 0)
+        self.assertTrue(status.is_dirty)
+
+    def test_ref_counts(self):
+        """Test branch, tag and stash counts."""
+        self._git(self.clean_repo, "tag", "v1.0")
+        self._git(self.clean_repo, "branch", "feature")
+        (self.clean_repo / "readme.txt").write_text("stash me")
+        self._git(self.clean_repo, "stash")
+        status = self.pulse.get_status(str(self.clean_repo))
+        self.assertEqual(status.branch_count, 2)
+        self.assertEqual(status.tag_count, 1)
+        self.assertEqual(status.stash_count, 1)
+        self.assertFalse(status.is_dirty)
+
+    def test_detached_head(self):
+        """Test detached HEAD detection."""
+        self._git(self.clean_repo, "checkout", "--detach")
+        status = self.pulse.get_status(str(self.clean_repo))
+        self.assertTrue(status.is_detached)
+        self.assertTrue(status.current_branch.startswith("(detached at "))
+
+    def test_repeat_status_reuses_cached_queries(self):
+        """Test that unchanged repos don't re-run metadata queries."""
+        calls = []
+        pulse = GitPulse()
+        run_git = pulse._run_git
+        pulse._run_git = lambda path, *args, **kw: calls.append(args) or run_git(
+            path, *args, **kw)
+
+        first = pulse.get_status(str(self.clean_repo))
+        calls.clear()
+        second = pulse.get_status(str(self.clean_repo))
+        self.assertEqual(calls, [])
+        self.assertEqual(first.to_dict(), second.to_dict())
+
+        self._make_commit(self.clean_repo, "Second commit")
+        third = pulse.get_status(str(self.clean_repo))
+        self.assertEqual(third.total_commits, first.total_commits + 1)
+        self.assertEqual(third.last_commit_message, "Second commit")
+
+    def test_cached_queries_see_nested_refs(self):
+        """Test that refs created in nested namespaces invalidate the cache."""
+        repo = str(self.clean_repo)
+        self._git(repo, "branch", "feat/x")
+        self._git(repo, "tag", "release/v2")
+        first = self.pulse.get_status(repo)
+        self._git(repo, "branch", "feat/y")
+        self._git(repo, "tag", "release/v3")
+        second = self.pulse.get_status(repo)
+        self.assertEqual(second.branch_count, first.branch_count + 1)
+        self.assertEqual(second.tag_count, first.tag_count + 1)
+
+    def test_query_cache_persists_between_instances(self):
+        """Test that cache_dir lets a new instance skip metadata queries."""
+        cache_dir = os.path.join(self.test_dir, "cache")
+        first = GitPulse(cache_dir=cache_dir).get_status(str(self.clean_repo))
+        self.assertTrue(os.listdir(cache_dir))
+
+        calls = []
+        pulse = GitPulse(cache_dir=cache_dir)
+        run_git = pulse._run_git
+        pulse._run_git = lambda path, *args, **kw: calls.append(args) or run_git(
+            path, *args, **kw)
+        second = pulse.get_status(str(self.clean_repo))
+        self.assertEqual(calls, [])
+        self.assertEqual(first.to_dict(), second.to_dict())
+
+        self._make_commit(self.clean_repo, "Second commit")
+        third = GitPulse(cache_dir=cache_dir).get_status(str(self.clean_repo))
+        self.assertEqual(third.total_commits, first.total_commits + 1)
+
+    def test_query_cache_file_sees_nested_refs(self):
+        """Test that nested refs invalidate the persisted query cache."""
+        cache_dir = os.path.join(self.test_dir, "cache")
+        repo = str(self.clean_repo)
+        self._git(repo, "branch", "feat/x")
+        self._git(repo, "tag", "release/v2")
+        first = GitPulse(cache_dir=cache_dir).get_status(repo)
+        self._git(repo, "branch", "feat/y")
+        self._git(repo, "tag", "release/v3")
+        second = GitPulse(cache_dir=cache_dir).get_status(repo)
+        self.assertEqual(second.branch_count, first.branch_count + 1)
+        self.assertEqual(second.tag_count, first.tag_count + 1)
+
+    def test_query_cache_file_sees_unshallow(self):
+        """Test that fetch --unshallow invalidates the persisted query cache."""
+        cache_dir = os.path.join(self.test_dir, "cache")
+        for i in range(4):
+            self._make_commit(self.clean_repo, f"Commit {i}")
+        shallow = os.path.join(self.test_dir, "shallow_repo")
+        self._git(self.test_dir, "clone", "-q", "--depth", "1",
+                  self.clean_repo.as_uri(), shallow)
+        first = GitPulse(cache_dir=cache_dir).get_status(shallow)
+        self.assertEqual(first.total_commits, 1)
+        self._git(shallow, "fetch", "-q", "--unshallow")
+        second = GitPulse(cache_dir=cache_dir).get_status(shallow)
+        self.assertEqual(second.total_commits, 5)
+
+    @unittest.skipIf(gitpulse.pygit2 is None, "pygit2 not installed")
+    def test_pygit2_backend_matches_git(self):
+        """Test that the pygit2 backend reports the same status as git."""
+        self._git(self.clean_repo, "tag", "v1.0")
+        # A staged rename and a file removed from the index only
+        fixtures = {
+            "moved_repo": ["mv", "readme.txt", "moved.txt"],
+            "uncached_repo": ["rm", "--cached", "readme.txt"],
+        }
+        for name, args in fixtures.items():
+            repo = os.path.join(self.test_dir, name)
+            shutil.copytree(str(self.clean_repo), repo, symlinks=True)
+            self._git(repo, *args)
+        git_result = self.pulse.scan(self.test_dir)
+        pygit2_result = GitPulse(backend="pygit2").scan(self.test_dir)
+        self.assertEqual(
+            [r.to_dict() for r in git_result.repos],
+            [r.to_dict() for r in pygit2_result.repos],
+        )
+        by_name = {r.name: r for r in pygit2_result.repos}
+        self.assertEqual(by_name["moved_repo"].deleted_count, 0)
+        self.assertEqual(by_name["moved_repo"].staged_count, 1)
+        self.assertEqual(by_name["uncached_repo"].deleted_count, 1)
+        self.assertEqual(by_name["uncached_repo"].untracked_count, 1)
+
     def test_find_dirty(self):
         """Test finding dirty repositories."""
         dirty = self.pulse.find_dirty(self.test_dir)
         self.assertEqual(len(dirty), 1)
         self.assertEqual(dirty[0].name, "dirty_repo")
 
+    def test_scan_filtered_groups_from_one_scan(self):
+        """Test that scan_filtered answers several filters with one scan."""
+        scans = []
+        scan = self.pulse.scan
+        self.pulse.scan = lambda root: scans.append(root) or scan(root)
+        groups = self.pulse.scan_filtered(self.test_dir, {
+            "dirty": lambda r: r.is_dirty,
+            "no_remote": lambda r: not r.has_remote,
+            "none": lambda r: False,
+        })
+        self.assertEqual(len(scans), 1)
+        self.assertEqual([r.name for r in groups["dirty"]], ["dirty_repo"])
+        self.assertEqual(len(groups["no_remote"]), 2)
+        self.assertEqual(groups["none"], [])
+
+    def test_find_stale_fast_matches_find_stale(self):
+        """Test that the date-only stale finder agrees with the full scan."""
+        old_repo = Path(self.test_dir) / "old_repo"
+        old_repo.mkdir()
+        self._init_repo(old_repo)
+        (old_repo / "readme.txt").write_text("old")
+        self._git(old_repo, "add", ".")
+        env = dict(os.environ, GIT_AUTHOR_DATE="2020-01-01T00:00:00+00:00")
+        self._git(old_repo, "commit", "-m", "Old commit", env=env)
+        full = self.pulse.find_stale(self.test_dir, days=30)
+        fast = self.pulse.find_stale_fast(self.test_dir, days=30)
+        self.assertEqual([r.name for r in fast], ["old_repo"])
+        self.assertEqual([r.path for r in fast], [r.path for r in full])
+        self.assertEqual(
+            fast[0].last_commit_age_days, full[0].last_commit_age_days
+        )
+        self.assertEqual(fast[0].last_commit_message, "Old commit")
+
     def test_scan_result_counts(self):
         """Test that scan result counts are accurate."""
         result = self.pulse.scan(self.test_dir)
@@ -386,6 +689,36 @@ class TestGitPulseWithRealRepos(unittest.TestCase):
             + result.critical_count + result.error_count
         )
 
+    def test_scan_single_worker_matches_parallel(self):
+        """Test that a sequential scan matches the parallel scan."""
+        serial = GitPulse(max_depth=3, max_workers=1).scan(self.test_dir)
+        parallel = GitPulse(max_depth=3, max_workers=8).scan(self.test_dir)
+        self.assertEqual(
+            [(r.name, r.health_score) for r in serial.repos],
+            [(r.name, r.health_score) for r in parallel.repos],
+        )
+
+    def test_scan_ttl_reuses_result(self):
+        """Test that scan_ttl lets chained finders share one scan."""
+        pulse = GitPulse(scan_ttl=60)
+        first = pulse.scan(self.test_dir)
+        pulse._find_repos = None  # A rescan would fail
+        self.assertEqual(len(pulse.find_dirty(self.test_dir)), 1)
+        self.assertEqual(len(pulse.find_no_remote(self.test_dir)), 2)
+        again = pulse.scan(self.test_dir)
+        again.repos.clear()
+        self.assertEqual(len(pulse.scan(self.test_dir).repos), len(first.repos))
+
+    def test_scan_reports_broken_repo(self):
+        """Test that a directory with an invalid .git is reported as an error."""
+        broken = Path(self.test_dir) / "broken_repo"
+        (broken / ".git").mkdir(parents=True)
+        result = self.pulse.scan(self.test_dir)
+        self.assertEqual(result.error_count, 1)
+        status = [r for r in result.repos if r.name == "broken_repo"][0]
+        self.assertIn("Not a valid git repo", status.error)
+        self.assertEqual(status.health_grade, "F")
+
     def test_scan_duration(self):
         """Test that scan duration is measured."""
         result = self.pulse.scan(self.test_dir)
@@ -400,6 +733,26 @@ class TestGitPulseWithRealRepos(unittest.TestCase):
         # Check it's a BranchInfo
         self.assertIsInstance(branches[0], BranchInfo)
 
+    def test_branches_tracking(self):
+        """Test upstream tracking and ahead counts in get_branches."""
+        clone = Path(self.test_dir) / "clone"
+        self._git(self.test_dir, "clone", str(self.clean_repo), str(clone))
+        self._init_repo(clone)
+        self._make_commit(clone, "Local work")
+        branches = self.pulse.get_branches(str(clone))
+        current = [b for b in branches if b.is_current]
+        self.assertEqual(len(current), 1)
+        self.assertTrue(current[0].tracking.startswith("origin/"))
+        self.assertEqual(current[0].ahead, 1)
+        self.assertEqual(current[0].behind, 0)
+        self.assertNotEqual(current[0].last_commit_date, "")
+
+    def test_branches_with_pipes_in_name(self):
+        """Test that branch names containing '|' are parsed intact."""
+        self._git(self.clean_repo, "branch", "fix|||pipes")
+        names = {b.name for b in self.pulse.get_branches(str(self.clean_repo))}
+        self.assertIn("fix|||pipes", names)
+
 
 class TestErrorHandling(unittest.TestCase):
     """Test error handling."""
@@ -442,6 +795,8 @@ class TestErrorHandling(unittest.TestCase):
         """Test find_stale with invalid days."""
         with self.assertRaises(ValueError):
             self.pulse.find_stale("/tmp", days=0)
+        with self.assertRaises(ValueError):
+            self.pulse.find_stale_fast("/tmp", days=0)
 
     def test_scan_file_not_directory(self):
         """Test scanning a file instead of directory."""
@@ -517,6 +872,31 @@ class TestOutputFormatters(unittest.TestCase):
         self.assertEqual(parsed["total_repos"], 2)
         self.assertEqual(len(parsed["repos"]), 2)
 
+    def test_format_json_matches_stdlib(self):
+        """Test that JSON output parses the same with or without orjson."""
+        result = self._make_result()
+        expected = json.loads(json.dumps(result.to_dict(), default=str))
+        self.assertEqual(json.loads(format_json(result)), expected)
+
+    def test_format_json_compact(self):
+        """Test compact JSON output has no whitespace between tokens."""
+        result = self._make_result()
+        compact = format_json(result, indent=None)
+        self.assertNotIn("\n", compact)
+        self.assertNotIn('": ', compact)
+        self.assertEqual(json.loads(compact), json.loads(format_json(result)))
+
+    def test_dump_json_streams_to_file(self):
+        """Test that JSON written to a stream matches json.dumps output."""
+        result = self._make_result()
+        buf = io.StringIO()
+        gitpulse._dump_json(result.to_dict(), buf)
+        self.assertTrue(buf.getvalue().endswith("}\n"))
+        self.assertEqual(
+            json.loads(buf.getvalue()),
+            json.loads(json.dumps(result.to_dict(), default=str)),
+        )
+
     def test_format_markdown(self):
         """Test Markdown formatter."""
         result = self._make_result()
@@ -553,6 +933,18 @@ class TestOutputFormatters(unittest.TestCase):
         self.assertIn("develop", text)
         self.assertIn("Total branches: 2", text)
 
+    def test_triage_sections(self):
+        """Test the dirty/stale/sync listings shared with the triage command."""
+        result = self._make_result()
+        dirty = [r for r in result.repos if r.is_dirty]
+        self.assertIn("[!] Found 1 dirty repo(s):", gitpulse._format_dirty_text(dirty))
+        self.assertEqual(
+            gitpulse._format_stale_text([], 30), "[OK] No repos stale (>30 days)."
+        )
+        self.assertEqual(
+            gitpulse._format_sync_text([], []), "[OK] All repositories are in sync!"
+        )
+
     def test_format_text_empty_scan(self):
         """Test text formatter with no repos."""
         result = ScanResult(
@@ -609,6 +1001,29 @@ class TestScanEmpty(unittest.TestCase):
             self.assertEqual(result.total_repos, 0)
 
 
+class TestCLIParser(unittest.TestCase):
+    """Test CLI argument parsing."""
+
+    def test_shared_scan_options(self):
+        """Test that scan-style commands all accept the shared options."""
+        parser = gitpulse._build_parser()
+        for command in ("scan", "dirty", "stale", "sync", "triage", "report"):
+            args = parser.parse_args([
+                command, ".", "-d", "2", "--ignore-symlinks", "--no-cache",
+                "--exact-commit-count", "--backend", "git", "-j", "2",
+            ])
+            self.assertEqual(args.depth, 2)
+            self.assertTrue(args.ignore_symlinks)
+            self.assertTrue(args.no_cache)
+            self.assertTrue(args.exact_commit_count)
+            self.assertEqual(args.workers, 2)
+        args = parser.parse_args(["scan", ".", "--exclude", "a", "--exclude", "b"])
+        self.assertEqual(args.exclude, ["a", "b"])
+        args = parser.parse_args(["status", ".", "--no-cache"])
+        self.assertTrue(args.no_cache)
+        self.assertFalse(hasattr(args, "depth"))
+
+
 class TestFindNoRemote(unittest.TestCase):
     """Test finding repos without remotes."""
 
@@ -619,24 +1034,27 @@ class TestFindNoRemote(unittest.TestCase):
             repo_path.mkdir()
             subprocess.run(
                 ["git", "init"], cwd=str(repo_path),
-                capture_output=True, text=True
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
             subprocess.run(
                 ["git", "config", "user.email", "test@test.com"],
-                cwd=str(repo_path), capture_output=True, text=True
+                cwd=str(repo_path),
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
             subprocess.run(
                 ["git", "config", "user.name", "Test"],
-                cwd=str(repo_path), capture_output=True, text=True
+                cwd=str(repo_path),
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
             (repo_path / "file.txt").write_text("content")
             subprocess.run(
                 ["git", "add", "."], cwd=str(repo_path),
-                capture_output=True, text=True
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
             subprocess.run(
                 ["git", "commit", "-m", "init"],
-                cwd=str(repo_path), capture_output=True, text=True
+                cwd=str(repo_path),
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
 
             pulse = GitPulse()
@@ -650,46 +1068,66 @@ class TestFindNoRemote(unittest.TestCase):
 # Test Runner
 # ---------------------------------------------------------------------------
 
+# Test classes run by run_tests(), in reporting order
+TEST_CLASSES = [
+    TestGitPulseInit,
+    TestRepoStatus,
+    TestScanResult,
+    TestHealthScoring,
+    TestGitPulseWithRealRepos,
+    TestErrorHandling,
+    TestOutputFormatters,
+    TestBranchInfo,
+    TestScanEmpty,
+    TestCLIParser,
+    TestFindNoRemote,
+]
+
+
+def _run_test_class(name):
+    """Run one test class in a worker process and report its results."""
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromTestCase(globals()[name])
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return (stream.getvalue(), result.testsRun, len(result.failures),
+            len(result.errors), result.wasSuccessful())
+
+
 def run_tests():
     """Run all tests with nice output."""
     print("=" * 70)
     print("TESTING: GitPulse v1.0.0")
     print("=" * 70)
 
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Add all test classes
-    test_classes = [
-        TestGitPulseInit,
-        TestRepoStatus,
-        TestScanResult,
-        TestHealthScoring,
-        TestGitPulseWithRealRepos,
-        TestErrorHandling,
-        TestOutputFormatters,
-        TestBranchInfo,
-        TestScanEmpty,
-        TestFindNoRemote,
-    ]
-
-    for cls in test_classes:
-        suite.addTests(loader.loadTestsFromTestCase(cls))
-
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    # Every class works in its own temp dirs and most of the time is
+    # spent waiting on git, so classes run in parallel processes. Their
+    # output is printed in order once each finishes.
+    names = [cls.__name__ for cls in TEST_CLASSES]
+    workers = min(len(names), os.cpu_count() or 1)
+    sys.stdout.flush()  # Don't let forked workers inherit buffered output
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(_run_test_class, names))
+
+    tests_run = failures = errors = 0
+    successful = True
+    for output, run, failed, errored, ok in outcomes:
+        sys.stderr.write(output)
+        tests_run += run
+        failures += failed
+        errors += errored
+        successful = successful and ok
 
     print("\n" + "=" * 70)
-    print(f"RESULTS: {result.testsRun} tests")
-    passed = result.testsRun - len(result.failures) - len(result.errors)
+    print(f"RESULTS: {tests_run} tests")
+    passed = tests_run - failures - errors
     print(f"[OK] Passed: {passed}")
-    if result.failures:
-        print(f"[X]  Failed: {len(result.failures)}")
-    if result.errors:
-        print(f"[X]  Errors: {len(result.errors)}")
+    if failures:
+        print(f"[X]  Failed: {failures}")
+    if errors:
+        print(f"[X]  Errors: {errors}")
     print("=" * 70)
 
-    return 0 if result.wasSuccessful() else 1
+    return 0 if successful else 1
 
 
 if __name__ == "__main__":